@@ -13,19 +13,23 @@ import numpy as np
 import warnings
 import os
 import glob
+import hashlib
+from typing import Optional
 from dotenv import load_dotenv
-warnings.filterwarnings('ignore')
+# Targeted filters only: pandas PerformanceWarnings flag slow code paths
+# and stay visible; Plotly's FutureWarnings are library noise
+warnings.filterwarnings('default', category=pd.errors.PerformanceWarning, module='pandas')
+warnings.filterwarnings('ignore', category=FutureWarning, module='plotly')
 
 # Load environment variables
 load_dotenv()
 
 # Import our trading engine components
-from strategy_base import Strategy
-from mean_reversion_strategy import MeanReversionQP
-from trend_strategy import SimpleTrend
-from momentum_strategy import MomentumStrategy
-from s3_data_loader import S3DataLoader
+from strategy_base import Strategy, index_level
+from s3_data_loader import S3DataLoader, downcast_ohlcv
+from export_utils import csv_bytes
 from config import AWSConfig
+from model_info import MODEL_INFO, BEST_FOR
 
 # ============================================================
 # PAGE CONFIGURATION
@@ -61,21 +65,168 @@ if 'ticker_filter' not in st.session_state:
 # HELPER FUNCTIONS
 # ============================================================
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_available_csv_files():
-    """Get list of CSV files in current directory."""
+    """Get list of CSV files in current directory (rescanned at most once a minute)."""
     csv_files = []
     # Match .csv files and files with .csv. pattern
     for pattern in ['*.csv', '*.csv.*']:
         csv_files.extend(glob.glob(pattern))
-    # Remove duplicates and sort
-    csv_files = sorted(list(set(csv_files)))
+    # Remove duplicates, skip Parquet cache sidecars and sort
+    csv_files = sorted(
+        f for f in set(csv_files)
+        if not f.endswith(('.parquet', PARQUET_META_SUFFIX))
+    )
     return csv_files if csv_files else ['NASDAQ.csv']  # Default if none found
 
 # ============================================================
 # DATA LOADING (WITH CACHING)
 # ============================================================
 
-@st.cache_data(ttl=3600, show_spinner="Loading market data...")
+PARQUET_META_SUFFIX = '.meta'
+REQUIRED_COLUMNS = ['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']
+TICKER_COLUMN_ALIASES = ('code', 'aokcode', 'symbol')  # 'aokCODE' after lowercase
+PARQUET_CACHE_VERSION = 4  # Bump whenever the parsed frame layout changes
+DIGEST_ATTR = '_digest'  # df.attrs key holding the content digest
+
+# Optional: xxhash digests several times faster than hashlib
+try:
+    import xxhash
+    _new_digest = xxhash.xxh64
+except ImportError:
+    def _new_digest():
+        return hashlib.blake2b(digest_size=8)
+
+
+def get_parquet_cache_paths(filepath: str) -> tuple:
+    """Return (parquet_path, meta_path) of the Parquet sidecar for a CSV file."""
+    parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+    return parquet_path, parquet_path + PARQUET_META_SUFFIX
+
+
+def fresh_parquet_cache(filepath: str) -> Optional[str]:
+    """
+    Return the path of a CSV file's Parquet sidecar if it is still fresh.
+    
+    The sidecar is only used while the CSV modification time and the cache
+    layout version match the ones recorded when the sidecar was written.
+    
+    Args:
+        filepath: Path to the source CSV file
+        
+    Returns:
+        Parquet path, or None if there is no fresh sidecar
+    """
+    parquet_path, meta_path = get_parquet_cache_paths(filepath)
+    
+    try:
+        with open(meta_path) as f:
+            cached_version, cached_mtime = f.read().split()
+        cached_version, cached_mtime = int(cached_version), float(cached_mtime)
+    except (OSError, ValueError):
+        return None
+    
+    if (cached_version != PARQUET_CACHE_VERSION
+            or cached_mtime != os.path.getmtime(filepath)
+            or not os.path.exists(parquet_path)):
+        return None
+    
+    return parquet_path
+
+
+def read_parquet_cache(filepath: str) -> Optional[pd.DataFrame]:
+    """
+    Read the parsed frame from the Parquet sidecar of a CSV file.
+    
+    Args:
+        filepath: Path to the source CSV file
+        
+    Returns:
+        Cached DataFrame, or None if there is no fresh sidecar
+    """
+    parquet_path = fresh_parquet_cache(filepath)
+    if parquet_path is None:
+        return None
+    
+    return pd.read_parquet(parquet_path, engine="pyarrow")
+
+
+def write_parquet_cache(filepath: str, df: pd.DataFrame):
+    """
+    Persist a parsed frame as a Parquet sidecar next to its CSV file.
+    
+    Failures (e.g. read-only deployments) are ignored; the CSV is simply
+    parsed again next time.
+    """
+    parquet_path, meta_path = get_parquet_cache_paths(filepath)
+    
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="zstd")
+        with open(meta_path, 'w') as f:
+            f.write(f"{PARQUET_CACHE_VERSION} {os.path.getmtime(filepath)!r}")
+    except OSError:
+        pass
+
+
+def attach_digest(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store a content digest of a loaded frame in `df.attrs[DIGEST_ATTR]`.
+    
+    Computed once per load; pages then key their caches on the stored
+    digest instead of re-hashing millions of rows on every rerun. The attrs
+    survive slicing, pickling (st.cache_data) and the Parquet sidecar.
+    
+    Args:
+        df: DataFrame with MultiIndex (date, ticker)
+        
+    Returns:
+        The same DataFrame, with the digest attached
+    """
+    digest = _new_digest()
+    
+    for codes, labels in zip(df.index.codes, df.index.levels):
+        digest.update(np.ascontiguousarray(codes).tobytes())
+        if labels.dtype.kind == 'M':
+            digest.update(labels.asi8.tobytes())
+        else:
+            digest.update('\0'.join(map(str, labels)).encode())
+    
+    for col in df.columns:
+        digest.update(col.encode())
+        digest.update(np.ascontiguousarray(df[col].to_numpy()).tobytes())
+    
+    df.attrs[DIGEST_ATTR] = digest.hexdigest()
+    return df
+
+
+def resolve_csv_columns(filepath: str) -> dict:
+    """
+    Map the CSV's own column names to the standard lowercase names.
+    
+    Only the header line is read. Column names are matched case-insensitively
+    and the ticker column may be named ticker, code, aokCODE or symbol.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        Dict of source column name -> standard name, for REQUIRED_COLUMNS only
+    """
+    column_map = {}
+    for col in pd.read_csv(filepath, nrows=0).columns:
+        name = col.lower()
+        if name in TICKER_COLUMN_ALIASES:
+            name = 'ticker'
+        if name in REQUIRED_COLUMNS and name not in column_map.values():
+            column_map[col] = name
+    
+    missing = [name for name in REQUIRED_COLUMNS if name not in column_map.values()]
+    if missing:
+        raise ValueError(f"{filepath} is missing required columns: {missing}")
+    
+    return column_map
+
+
 def load_nasdaq_data(
     filepath: str = "NASDAQ.csv",
     use_s3: bool = None,
@@ -85,6 +236,13 @@ def load_nasdaq_data(
     Load NASDAQ data with aggressive caching for performance.
     Data is cached for 1 hour to avoid repeated S3 downloads.
     
+    The cache key includes the file's modification time, so an edited or
+    regenerated CSV is reloaded immediately instead of after the TTL.
+    
+    The frame is cached as a shared resource: every rerun and session gets
+    the same object (no per-rerun unpickling copy), so callers must treat
+    it as read-only and slice or copy before modifying.
+    
     Args:
         filepath: Path to the CSV file (used for local files or as S3 key)
         use_s3: Whether to use S3 (if None, uses config setting)
@@ -93,6 +251,18 @@ def load_nasdaq_data(
     Returns:
         DataFrame with MultiIndex (date, ticker) and OHLCV columns
     """
+    mtime = os.path.getmtime(filepath) if os.path.exists(filepath) else None
+    return _load_nasdaq_data(filepath, mtime, use_s3, force_local)
+
+
+@st.cache_resource(ttl=3600, show_spinner="Loading market data...")
+def _load_nasdaq_data(
+    filepath: str,
+    mtime: Optional[float],
+    use_s3: bool,
+    force_local: bool
+) -> pd.DataFrame:
+    """Cached body of `load_nasdaq_data`, keyed on (filepath, mtime, flags)."""
     # Load AWS configuration
     aws_config = AWSConfig()
     
@@ -115,48 +285,61 @@ def load_nasdaq_data(
                 cache_ttl_hours=24  # Cache for 24 hours
             )
             
-            return df
+            return attach_digest(downcast_ohlcv(df))
             
         else:
-            # Load from local file
-            df = pd.read_csv(filepath)
+            # Reuse the Parquet sidecar if the CSV has not changed since it was written
+            df = read_parquet_cache(filepath)
+            if df is not None:
+                return df if DIGEST_ATTR in df.attrs else attach_digest(df)
             
-            # Standardize column names (lowercase)
-            df.columns = df.columns.str.lower()
+            # Resolve the header first so only the needed columns are parsed
+            column_map = resolve_csv_columns(filepath)
+            source = {name: col for col, name in column_map.items()}
             
-            # Rename columns to match expected format
-            # Handle various column name formats: 'code', 'aokcode', etc.
-            column_mapping = {
-                'code': 'ticker',
-                'aokcode': 'ticker',  # Handle 'aokCODE' after lowercase
-                'ticker': 'ticker',
-                'date': 'date',
-                'open': 'open',
-                'high': 'high',
-                'low': 'low',
-                'close': 'close',
-                'volume': 'volume'
-            }
-            df = df.rename(columns=column_mapping)
-            
-            # Convert date to datetime (YYYY-MM-DD format)
-            df['date'] = pd.to_datetime(df['date'])
+            # Load from local file using the multithreaded Arrow CSV reader,
+            # with explicit dtypes so no inference or re-parsing passes are
+            # needed (volume is read as float64: it may contain blanks)
+            df = pd.read_csv(
+                filepath,
+                engine="pyarrow",
+                usecols=list(column_map),
+                dtype={
+                    source['ticker']: 'category',
+                    source['open']: 'float32',
+                    source['high']: 'float32',
+                    source['low']: 'float32',
+                    source['close']: 'float32',
+                    source['volume']: 'float64'
+                },
+                parse_dates=[source['date']]
+            )
             
-            # Keep only required columns
-            required_cols = ['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']
-            df = df[required_cols]
+            # Standardize column names and order
+            df = df.rename(columns=column_map)[REQUIRED_COLUMNS]
             
             # Remove rows with missing/NaN ticker values
             df = df.dropna(subset=['ticker'])
             
-            # Ensure ticker is string type
-            df['ticker'] = df['ticker'].astype(str)
+            # Downcast OHLCV (float32 prices, uint32 volume)
+            df = downcast_ohlcv(df)
+            
+            # Ticker is stored as a categorical (int codes + one array of unique
+            # tickers instead of a Python str per row); ensure string labels
+            if not pd.api.types.is_string_dtype(df['ticker'].cat.categories):
+                df['ticker'] = df['ticker'].cat.rename_categories(str)
             
             # Set MultiIndex
             df = df.set_index(['date', 'ticker'])
             
-            # Sort index
-            df = df.sort_index()
+            # Sort index (skipped when the CSV is already in date/ticker order)
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            
+            # Persist the parsed frame (digest included) so later cold
+            # starts skip CSV parsing
+            attach_digest(df)
+            write_parquet_cache(filepath, df)
             
             return df
         
@@ -171,136 +354,145 @@ def load_nasdaq_data(
         st.info("💡 Run test_s3_connection.py to debug S3 connection")
         return None
 
-# ============================================================
-# MODEL METADATA
-# ============================================================
 
-MODEL_INFO = {
-    "Mean Reversion": {
-        "class": MeanReversionQP,
-        "short_desc": "Buys undervalued assets when price deviates below historical mean, assuming reversion to equilibrium.",
-        "description": """
-        **Mean Reversion (Quality-Price Indicator)**
-        
-        This strategy identifies undervalued assets by calculating a Quality-Price Indicator (QPI) 
-        that measures how far current prices deviate from their historical average relative to volatility.
-        
-        **Core Logic:**
-        - Calculates moving average and volatility over lookback periods
-        - Computes QPI = (Price - MA) / Historical Volatility
-        - Generates buy signals when QPI is low (price below mean)
-        - Assumes prices will revert to the mean over time
-        
-        **Best Use Cases:**
-        - Range-bound markets with clear support/resistance
-        - Assets with stable fundamental values
-        - Markets with cyclical behavior
-        """,
-        "assumptions": [
-            "Asset prices oscillate around a stable mean",
-            "Volatility is relatively constant over time",
-            "No structural breaks or regime changes",
-            "Sufficient liquidity for mean reversion to occur"
-        ],
-        "hyperparameters": {
-            "lookback_ma": {
-                "name": "MA Lookback Period",
-                "description": "Number of periods to calculate moving average",
-                "default": 50,
-                "range": (20, 200),
-                "impact": "Shorter = more responsive to price changes, Longer = smoother trend"
-            },
-            "lookback_vol": {
-                "name": "Volatility Lookback Period",
-                "description": "Number of periods to calculate volatility",
-                "default": 20,
-                "range": (10, 60),
-                "impact": "Affects sensitivity to price deviations"
-            },
-            "historical_vol_period": {
-                "name": "Historical Volatility Period",
-                "description": "Extended period for calculating baseline volatility",
-                "default": 100,
-                "range": (50, 500),
-                "impact": "Longer period = more stable volatility estimates"
-            }
-        }
-    },
-    
-    "Trend Following": {
-        "class": SimpleTrend,
-        "short_desc": "Follows momentum by comparing price to moving average, buying when price is above trend.",
-        "description": """
-        **Simple Trend Following Strategy**
-        
-        This strategy captures momentum by identifying assets trading above their moving average,
-        indicating an established uptrend.
-        
-        **Core Logic:**
-        - Calculates Simple Moving Average (SMA) over specified period
-        - Compares current price to SMA
-        - Generates buy signals when price > SMA (uptrend)
-        - Signal strength based on distance from SMA
-        
-        **Best Use Cases:**
-        - Trending markets with clear directional moves
-        - Breakout scenarios
-        - Momentum-driven assets (tech stocks, growth sectors)
-        """,
-        "assumptions": [
-            "Trends persist over time (momentum effect)",
-            "Price above MA indicates continued upward movement",
-            "Market exhibits trending behavior vs. mean reversion",
-            "Transaction costs don't erode trend profits"
-        ],
-        "hyperparameters": {
-            "sma_period": {
-                "name": "SMA Period",
-                "description": "Number of periods for moving average calculation",
-                "default": 100,
-                "range": (20, 200),
-                "impact": "Shorter = captures short-term trends, Longer = focuses on major trends"
-            }
-        }
-    },
-    
-    "Momentum": {
-        "class": MomentumStrategy,
-        "short_desc": "Ranks assets by recent price performance, buying strongest performers expecting continuation.",
-        "description": """
-        **Momentum Strategy (Rate of Change)**
-        
-        This strategy selects assets with the strongest recent price performance,
-        based on the principle that past winners tend to continue winning.
-        
-        **Core Logic:**
-        - Calculates rate of change over lookback period
-        - Ranks assets by momentum score
-        - Generates signals favoring top performers
-        - Continuous rebalancing to maintain momentum exposure
-        
-        **Best Use Cases:**
-        - Bull markets with clear sector leaders
-        - Growth-oriented portfolios
-        - High-volatility environments with persistent trends
-        """,
-        "assumptions": [
-            "Past performance predicts future performance (short-term)",
-            "Winner momentum persists for the holding period",
-            "Market rewards risk-taking in uptrends",
-            "Sufficient liquidity to enter/exit positions"
-        ],
-        "hyperparameters": {
-            "lookback_period": {
-                "name": "Momentum Lookback Period",
-                "description": "Number of periods to calculate momentum",
-                "default": 20,
-                "range": (5, 60),
-                "impact": "Shorter = more reactive to recent changes, Longer = more stable signals"
-            }
-        }
+# Callers clear the loader cache through the public wrapper
+load_nasdaq_data.clear = _load_nasdaq_data.clear
+
+
+def get_data_stats(market_data: pd.DataFrame) -> dict:
+    """
+    Summary statistics of a loaded frame, computed once per content digest.
+    
+    Args:
+        market_data: Frame returned by `load_nasdaq_data`
+        
+    Returns:
+        Dict with 'total_records', 'num_tickers', 'start_date', 'end_date',
+        'all_tickers' (sorted ticker strings), 'dates' (sorted date level)
+        and 'rows_before_date' (cumulative row counts, one longer than
+        'dates', for counting the rows of any date range)
+    """
+    if DIGEST_ATTR not in market_data.attrs:
+        attach_digest(market_data)
+    return _get_data_stats(market_data.attrs[DIGEST_ATTR], market_data)
+
+
+def get_sample_csv(market_data: pd.DataFrame, num_rows: int = 10000) -> bytes:
+    """
+    CSV bytes of the first rows of a loaded frame, built once per content digest.
+    
+    Args:
+        market_data: Frame returned by `load_nasdaq_data`
+        num_rows: Number of leading rows to export
+        
+    Returns:
+        CSV file contents
+    """
+    if DIGEST_ATTR not in market_data.attrs:
+        attach_digest(market_data)
+    return _get_sample_csv(market_data.attrs[DIGEST_ATTR], num_rows, market_data)
+
+
+@st.cache_data(show_spinner=False)
+def _get_sample_csv(digest: str, num_rows: int, _market_data: pd.DataFrame) -> bytes:
+    """Cached body of `get_sample_csv`, keyed on the loader's content digest."""
+    return csv_bytes(_market_data.iloc[:num_rows])
+
+
+def render_data_stats(stats: dict, columns: Optional[list] = None, combined_range: bool = False):
+    """
+    Render the record/ticker/date-range metrics of `get_data_stats`.
+    
+    Args:
+        stats: Dict returned by `get_data_stats`
+        columns: Streamlit columns to fill (default: new columns, one per metric)
+        combined_range: Show start and end as a single "Date Range" metric
+    """
+    if columns is None:
+        columns = st.columns(3 if combined_range else 4)
+    
+    columns[0].metric("Total Records", f"{stats['total_records']:,}")
+    columns[1].metric("Unique Tickers", stats['num_tickers'])
+    
+    if combined_range:
+        columns[2].metric("Date Range", f"{str(stats['start_date'].date())} to {str(stats['end_date'].date())}")
+    else:
+        columns[2].metric("Start Date", str(stats['start_date'].date()))
+        columns[3].metric("End Date", str(stats['end_date'].date()))
+
+
+def get_source_summary(filepath: str) -> Optional[dict]:
+    """
+    Record/ticker/date-range metrics of a local CSV without loading it.
+    
+    Only the date and ticker columns are read (from the Parquet sidecar when
+    it is fresh, else from the CSV), so pages that just show the metrics
+    skip parsing and holding the OHLCV columns.
+    
+    Args:
+        filepath: Path to the CSV file
+        
+    Returns:
+        Dict with the 'total_records', 'num_tickers', 'start_date' and
+        'end_date' keys of `get_data_stats`, or None when the data comes
+        from S3 or the file does not exist (load the full frame instead)
+    """
+    if AWSConfig().use_s3 or not os.path.exists(filepath):
+        return None
+    return _get_source_summary(filepath, os.path.getmtime(filepath))
+
+
+@st.cache_data(show_spinner=False)
+def _get_source_summary(filepath: str, mtime: float) -> dict:
+    """Cached body of `get_source_summary`, keyed on (filepath, mtime)."""
+    parquet_path = fresh_parquet_cache(filepath)
+    if parquet_path is not None:
+        # Index levels only (stored as the 'date'/'ticker' columns)
+        index = pd.read_parquet(parquet_path, engine="pyarrow", columns=['date', 'ticker']).index
+        dates = index.get_level_values('date')
+        tickers = index.get_level_values('ticker')
+    else:
+        column_map = resolve_csv_columns(filepath)
+        source = {name: col for col, name in column_map.items()}
+        
+        df = pd.read_csv(
+            filepath,
+            engine="pyarrow",
+            usecols=[source['date'], source['ticker']],
+            dtype={source['ticker']: 'category'},
+            parse_dates=[source['date']]
+        ).dropna(subset=[source['ticker']])
+        dates = df[source['date']]
+        tickers = df[source['ticker']]
+    
+    return {
+        'total_records': len(dates),
+        'num_tickers': tickers.nunique(),
+        'start_date': dates.min(),
+        'end_date': dates.max(),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _get_data_stats(digest: str, _market_data: pd.DataFrame) -> dict:
+    """Cached body of `get_data_stats`, keyed on the loader's content digest."""
+    # Read from the index levels (no per-row label arrays)
+    tickers = index_level(_market_data.index, 'ticker')[1]
+    date_codes, dates = index_level(_market_data.index, 'date')
+    
+    rows_before_date = np.zeros(len(dates) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(date_codes, minlength=len(dates)), out=rows_before_date[1:])
+    
+    return {
+        'total_records': len(_market_data),
+        'num_tickers': len(tickers),
+        'start_date': dates.min(),
+        'end_date': dates.max(),
+        'all_tickers': sorted(str(t) for t in tickers if pd.notna(t)),
+        'dates': dates,
+        'rows_before_date': rows_before_date,
     }
-}
+
 
 # ============================================================
 # SIDEBAR NAVIGATION
@@ -320,10 +512,14 @@ if current_source not in available_csv_files:
     available_csv_files.append(current_source)
     available_csv_files = sorted(available_csv_files)
 
+# Source selectors are driven by their session state keys (the Data page's
+# Load Data button updates them too)
+st.session_state.setdefault('csv_selector', current_source)
+st.session_state.setdefault('data_file_input', current_source)
+
 selected_csv = st.sidebar.selectbox(
     "Select CSV file:",
     options=available_csv_files,
-    index=available_csv_files.index(current_source) if current_source in available_csv_files else 0,
     help="Choose the data file to use for analysis",
     key="csv_selector"
 )
@@ -331,6 +527,7 @@ selected_csv = st.sidebar.selectbox(
 # Update session state if changed
 if selected_csv != st.session_state.data_source:
     st.session_state.data_source = selected_csv
+    st.session_state.data_file_input = selected_csv
     # Clear cache to reload data
     load_nasdaq_data.clear()
     st.rerun()
@@ -412,24 +609,16 @@ if st.session_state.current_page == "Home":
     st.info(f"📁 **Active Data Source:** `{st.session_state.data_source}`")
     
     with st.spinner("Loading data statistics..."):
-        market_data = load_nasdaq_data(st.session_state.data_source)
+        # Local files: read just the date/ticker columns for the metrics
+        summary = get_source_summary(st.session_state.data_source)
         
-        if market_data is not None:
-            num_tickers = len(market_data.index.get_level_values('ticker').unique())
-            date_range = market_data.index.get_level_values('date').unique()
-            start_date = date_range.min()
-            end_date = date_range.max()
-            
-            col_a, col_b, col_c, col_d = st.columns(4)
-            
-            with col_a:
-                st.metric("Total Records", f"{len(market_data):,}")
-            with col_b:
-                st.metric("Unique Tickers", num_tickers)
-            with col_c:
-                st.metric("Start Date", str(start_date.date()))
-            with col_d:
-                st.metric("End Date", str(end_date.date()))
+        if summary is None:
+            market_data = load_nasdaq_data(st.session_state.data_source)
+            if market_data is not None:
+                summary = get_data_stats(market_data)
+        
+        if summary is not None:
+            render_data_stats(summary)
 
 elif st.session_state.current_page == "Data":
     # DATA CONFIGURATION PAGE
@@ -445,20 +634,26 @@ elif st.session_state.current_page == "Data":
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        data_file = st.text_input(
-            "CSV Filename",
-            value=st.session_state.data_source,
-            help="Enter the filename of your CSV data file",
+        # Only files that exist can be chosen (no failed loads on typos)
+        data_file = st.selectbox(
+            "CSV File",
+            options=available_csv_files,
+            help="Choose the CSV data file (files in the current directory)",
             key="data_file_input"
         )
     
+    def use_selected_source():
+        # Runs before the next rerun, so the sidebar selector can be synced
+        # too (otherwise it would switch the source straight back)
+        st.session_state.data_source = st.session_state.data_file_input
+        st.session_state.csv_selector = st.session_state.data_file_input
+        # Clear cache to reload data
+        load_nasdaq_data.clear()
+    
     with col2:
-        if st.button("📥 Load Data", type="primary", use_container_width=True):
-            st.session_state.data_source = data_file
-            # Clear cache to reload data
-            load_nasdaq_data.clear()
+        if st.button("📥 Load Data", type="primary", use_container_width=True,
+                     on_click=use_selected_source):
             st.success(f"✅ Data source updated to: {data_file}")
-            st.rerun()
     
     st.markdown("---")
     
@@ -482,21 +677,13 @@ elif st.session_state.current_page == "Data":
         st.success(f"✅ Successfully loaded from {data_source_info}: {st.session_state.data_source}")
         
         # Display metrics
-        num_tickers = len(market_data.index.get_level_values('ticker').unique())
-        date_range = market_data.index.get_level_values('date').unique()
-        start_date = date_range.min()
-        end_date = date_range.max()
+        stats = get_data_stats(market_data)
+        start_date = stats['start_date']
+        end_date = stats['end_date']
         
         col_a, col_b, col_c, col_d, col_e = st.columns([1, 1, 1, 1, 1])
+        render_data_stats(stats, [col_a, col_b, col_c, col_d])
         
-        with col_a:
-            st.metric("Total Records", f"{len(market_data):,}")
-        with col_b:
-            st.metric("Unique Tickers", num_tickers)
-        with col_c:
-            st.metric("Start Date", str(start_date.date()))
-        with col_d:
-            st.metric("End Date", str(end_date.date()))
         with col_e:
             if st.button("🔄 Refresh Data", help="Clear cache and reload from S3", use_container_width=True):
                 # Delete local cache file
@@ -508,22 +695,33 @@ elif st.session_state.current_page == "Data":
         
         st.markdown("---")
         
-        # Date Range Filtering
-        st.subheader("📅 Date Range Filter")
+        # Filters are edited inside a form: changing a widget does not rerun
+        # the page, everything is applied together on submit
+        filter_types = {
+            "Use All Tickers": None,
+            "Select Specific Tickers": "include",
+            "Exclude Tickers": "exclude"
+        }
         
-        enable_filter = st.checkbox(
-            "Enable date range filtering for simulations",
-            value=st.session_state.date_filter_enabled,
-            help="When enabled, only data within the selected range will be used"
-        )
+        # Unique tickers as strings, NaN filtered out (cached with the stats)
+        all_tickers = stats['all_tickers']
         
-        if enable_filter:
+        with st.form("data_filters"):
+            # Date Range Filtering
+            st.subheader("📅 Date Range Filter")
+            
+            enable_filter = st.checkbox(
+                "Enable date range filtering for simulations",
+                value=st.session_state.date_filter_enabled,
+                help="When enabled, only data within the selected range will be used"
+            )
+            
             col_date1, col_date2 = st.columns(2)
             
             with col_date1:
                 filter_start = st.date_input(
                     "Start Date",
-                    value=start_date,
+                    value=min(max(st.session_state.get('date_filter_start', start_date), start_date), end_date),
                     min_value=start_date,
                     max_value=end_date
                 )
@@ -531,70 +729,71 @@ elif st.session_state.current_page == "Data":
             with col_date2:
                 filter_end = st.date_input(
                     "End Date",
-                    value=end_date,
+                    value=min(max(st.session_state.get('date_filter_end', end_date), start_date), end_date),
                     min_value=start_date,
                     max_value=end_date
                 )
             
-            st.session_state.date_filter_enabled = True
-            st.session_state.date_filter_start = pd.Timestamp(filter_start)
-            st.session_state.date_filter_end = pd.Timestamp(filter_end)
+            st.markdown("---")
             
-            filtered_data = market_data.loc[
-                (market_data.index.get_level_values('date') >= pd.Timestamp(filter_start)) &
-                (market_data.index.get_level_values('date') <= pd.Timestamp(filter_end))
-            ]
+            # Ticker Selection
+            st.subheader("🎯 Ticker Filter")
             
-            st.info(f"📊 Filtered: {len(filtered_data):,} records ({len(filtered_data) / len(market_data) * 100:.1f}% of total)")
-        else:
-            st.session_state.date_filter_enabled = False
-        
-        st.markdown("---")
-        
-        # Ticker Selection
-        st.subheader("🎯 Ticker Filter")
-        
-        # Get unique tickers and ensure they're strings, filter out NaN
-        tickers = market_data.index.get_level_values('ticker').unique()
-        all_tickers = sorted([str(t) for t in tickers if pd.notna(t)])
-        
-        filter_type = st.radio(
-            "Filter type:",
-            ["Use All Tickers", "Select Specific Tickers", "Exclude Tickers"],
-            horizontal=True
-        )
-        
-        if filter_type == "Select Specific Tickers":
+            filter_type = st.radio(
+                "Filter type:",
+                list(filter_types),
+                index=list(filter_types.values()).index(st.session_state.get('ticker_filter_type')),
+                horizontal=True
+            )
+            
+            ticker_options = set(all_tickers)
             selected_tickers = st.multiselect(
-                "Select tickers to include:",
+                "Tickers to include or exclude:",
                 options=all_tickers,
-                default=all_tickers[:10] if len(all_tickers) > 10 else all_tickers,
-                help="Only selected tickers will be used"
+                default=[t for t in (st.session_state.ticker_filter or []) if t in ticker_options],
+                help="Used by 'Select Specific Tickers' (only these) and 'Exclude Tickers' (all but these)"
             )
-            st.session_state.ticker_filter = selected_tickers
-            st.session_state.ticker_filter_type = "include"
-            st.info(f"📊 Selected {len(selected_tickers)} tickers")
+            
+            submitted = st.form_submit_button("✅ Apply Filters", type="primary")
         
-        elif filter_type == "Exclude Tickers":
-            excluded_tickers = st.multiselect(
-                "Select tickers to exclude:",
-                options=all_tickers,
-                help="These tickers will be excluded"
-            )
-            st.session_state.ticker_filter = excluded_tickers
-            st.session_state.ticker_filter_type = "exclude"
-            if excluded_tickers:
-                st.info(f"📊 Excluding {len(excluded_tickers)} tickers ({len(all_tickers) - len(excluded_tickers)} remaining)")
-        else:
-            st.session_state.ticker_filter = None
-            st.session_state.ticker_filter_type = None
+        if submitted:
+            st.session_state.date_filter_enabled = enable_filter
+            if enable_filter:
+                st.session_state.date_filter_start = pd.Timestamp(filter_start)
+                st.session_state.date_filter_end = pd.Timestamp(filter_end)
+            
+            # An empty include list would leave no data to simulate: keep the
+            # previous ticker filter instead
+            ticker_filter_type = filter_types[filter_type]
+            if ticker_filter_type == "include" and not selected_tickers:
+                st.warning("⚠️ Select at least one ticker to include; the ticker filter was not changed.")
+            else:
+                st.session_state.ticker_filter = list(selected_tickers) if ticker_filter_type else None
+                st.session_state.ticker_filter_type = ticker_filter_type
+        
+        # Summary of the applied filters
+        if st.session_state.date_filter_enabled:
+            # Count matching rows from the cached per-date counts: two binary
+            # searches on the sorted date level, no pass over the rows
+            first = stats['dates'].searchsorted(st.session_state.date_filter_start, side='left')
+            last = stats['dates'].searchsorted(st.session_state.date_filter_end, side='right')
+            num_filtered = int(stats['rows_before_date'][last] - stats['rows_before_date'][first])
+            
+            st.info(f"📊 Filtered: {num_filtered:,} records ({num_filtered / stats['total_records'] * 100:.1f}% of total)")
+        
+        if st.session_state.get('ticker_filter_type') == "include":
+            st.info(f"📊 Selected {len(st.session_state.ticker_filter)} tickers")
+        elif st.session_state.get('ticker_filter_type') == "exclude" and st.session_state.ticker_filter:
+            excluded_tickers = st.session_state.ticker_filter
+            st.info(f"📊 Excluding {len(excluded_tickers)} tickers ({len(all_tickers) - len(excluded_tickers)} remaining)")
         
         st.markdown("---")
         
         # Sample Data Preview
         st.subheader("👀 Data Sample")
         preview_rows = st.slider("Number of rows to preview", 5, 100, 20)
-        st.dataframe(market_data.head(preview_rows), use_container_width=True)
+        # iloc slice rather than head(): head() deep-copies the rows first
+        st.dataframe(market_data.iloc[:preview_rows], use_container_width=True)
     
     else:
         st.error(f"❌ Failed to load data from: {st.session_state.data_source}")
@@ -612,8 +811,8 @@ elif st.session_state.current_page == "Models":
         
         for model_name, info in MODEL_INFO.items():
             with st.expander(f"📈 **{model_name}**", expanded=False):
-                st.markdown(f"**Description:** {info['short_desc']}")
-                st.markdown(f"**Best For:** {info['description'].split('**Best Use Cases:**')[1].split('**')[0].strip()}")
+                st.markdown(f"**Description:** {info.short_desc}")
+                st.markdown(f"**Best For:** {BEST_FOR[model_name]}")
                 
                 if st.button(f"View Details →", key=f"details_{model_name}"):
                     st.session_state.current_model = model_name
@@ -634,13 +833,13 @@ elif st.session_state.current_page == "Models":
         
         # Description
         st.subheader("📝 Description")
-        st.markdown(model_info['description'])
+        st.markdown(model_info.description)
         
         st.markdown("---")
         
         # Assumptions
         st.subheader("⚠️ Key Assumptions")
-        for assumption in model_info['assumptions']:
+        for assumption in model_info.assumptions:
             st.markdown(f"- {assumption}")
         
         st.markdown("---")
@@ -648,12 +847,12 @@ elif st.session_state.current_page == "Models":
         # Hyperparameters
         st.subheader("⚙️ Hyperparameters")
         
-        for param_key, param_info in model_info['hyperparameters'].items():
-            with st.expander(f"**{param_info['name']}**", expanded=False):
-                st.markdown(f"**Description:** {param_info['description']}")
-                st.markdown(f"**Default Value:** {param_info['default']}")
-                st.markdown(f"**Typical Range:** {param_info['range'][0]} - {param_info['range'][1]}")
-                st.markdown(f"**Impact:** {param_info['impact']}")
+        for param_key, param_info in model_info.hyperparameters.items():
+            with st.expander(f"**{param_info.name}**", expanded=False):
+                st.markdown(f"**Description:** {param_info.description}")
+                st.markdown(f"**Default Value:** {param_info.default}")
+                st.markdown(f"**Typical Range:** {param_info.range[0]} - {param_info.range[1]}")
+                st.markdown(f"**Impact:** {param_info.impact}")
 
 elif st.session_state.current_page == "Run Simulation":
     # Import simulation page components
@@ -672,31 +871,23 @@ elif st.session_state.current_page == "Data Explorer":
         st.success("✅ Data loaded successfully")
         
         # Data info
-        num_tickers = len(market_data.index.get_level_values('ticker').unique())
-        date_range = market_data.index.get_level_values('date').unique()
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total Records", f"{len(market_data):,}")
-        with col2:
-            st.metric("Unique Tickers", num_tickers)
-        with col3:
-            st.metric("Date Range", f"{str(date_range.min().date())} to {str(date_range.max().date())}")
+        render_data_stats(get_data_stats(market_data), combined_range=True)
         
         st.markdown("---")
         
         # Data preview
         st.subheader("📋 Data Preview")
         sample_size = st.slider("Number of rows to display", 10, 1000, 100)
-        st.dataframe(market_data.head(sample_size), width='stretch', height=400)
+        st.dataframe(market_data.iloc[:sample_size], width='stretch', height=400)
         
         # Export
         st.markdown("---")
         st.subheader("💾 Export Data")
-        csv = market_data.head(10000).to_csv()
+        
+        # Serialized once per loaded frame (see get_sample_csv)
         st.download_button(
             label="📥 Download Sample (10,000 rows)",
-            data=csv,
+            data=get_sample_csv(market_data),
             file_name="market_data_sample.csv",
             mime="text/csv"
         )
@@ -4,6 +4,8 @@ Architecture Visualization
 Visual representation of the Ensemble Trading System architecture.
 """
 
+import sys
+
 ARCHITECTURE = """
 ┌─────────────────────────────────────────────────────────────────────────┐
 │                    ENSEMBLE TRADING SYSTEM                              │
@@ -212,12 +214,8 @@ That's the power of modular design! 🚀
 
 
 def print_architecture():
-    """Print the architecture diagram."""
-    print(ARCHITECTURE)
-    print("\n")
-    print(COMPONENT_DETAILS)
-    print("\n")
-    print(HOW_TO_EXTEND)
+    """Print the architecture diagram (one write, sections separated by blank lines)."""
+    sys.stdout.write("\n\n\n".join((ARCHITECTURE, COMPONENT_DETAILS, HOW_TO_EXTEND)) + "\n")
 
 
 if __name__ == "__main__":
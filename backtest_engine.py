@@ -6,10 +6,14 @@ Event-driven backtest with standard performance metrics.
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from datetime import datetime
 
+from strategy_base import CloseMatrix, close_matrix, index_level
+from numba_kernels import drawdown as equity_drawdown, equity_stats, simulate_rebalance
+
 
 class BacktestEngine:
     """
@@ -35,10 +39,51 @@ class BacktestEngine:
         self.slippage = slippage
         
         # Performance tracking
-        self.equity_curve = []
-        self.daily_returns = []
-        self.positions_history = []
-        self.trades = []
+        self.equity_curve = pd.DataFrame()
+        self.daily_returns = np.empty(0)
+        
+        # Per-run trade/holding record arrays (see `simulate_rebalance`) with
+        # the date and ticker labels they index; the dict views `trades` and
+        # `positions_history` are only built when accessed
+        self._runs = []
+        self._trades = None
+        self._positions_history = None
+    
+    @property
+    def trades(self) -> list:
+        """Trade log: one dict (date, ticker, action, shares, price, pnl) per fill."""
+        if self._trades is None:
+            self._trades = []
+            for trades, _, dates, tickers in self._runs:
+                date_labels, ticker_labels = dates.tolist(), tickers.tolist()
+                self._trades.extend(
+                    {'date': date_labels[int(t)], 'ticker': ticker_labels[int(col)],
+                     'action': 'BUY' if shares > 0 else 'SELL',
+                     'shares': abs(shares), 'price': price, 'pnl': pnl}
+                    for t, col, shares, price, pnl in trades.tolist()
+                )
+        return self._trades
+    
+    @property
+    def positions_history(self) -> list:
+        """Daily snapshots: {'date', 'positions': {ticker: (shares, entry_price)}}."""
+        if self._positions_history is None:
+            self._positions_history = []
+            for _, holdings, dates, tickers in self._runs:
+                date_labels, ticker_labels = dates.tolist(), tickers.tolist()
+                bounds = np.searchsorted(holdings[:, 0], np.arange(len(dates) + 1)).tolist()
+                rows = holdings[:, 1:].tolist()
+                self._positions_history.extend(
+                    {'date': date,
+                     'positions': {ticker_labels[int(col)]: (shares, entry_price)
+                                   for col, shares, entry_price in rows[bounds[t]:bounds[t + 1]]}}
+                    for t, date in enumerate(date_labels)
+                )
+        return self._positions_history
+    
+    def _trade_pnl(self) -> np.ndarray:
+        """P&L column of every recorded trade (0 for entries and resizes)."""
+        return np.concatenate([trades[:, 4] for trades, *_ in self._runs] or [np.empty(0)])
     
     def run(self, 
             data: pd.DataFrame, 
@@ -60,150 +105,165 @@ class BacktestEngine:
         print(f"Commission: {self.commission*100:.2f}%")
         print(f"Slippage: {self.slippage*100:.3f}%")
         
-        # Get unique dates
-        dates = data.index.get_level_values('date').unique().sort_values()
-        
-        # Initialize portfolio
-        cash = self.initial_capital
-        positions = {}  # ticker -> (shares, entry_price)
-        portfolio_value = self.initial_capital
-        
-        for i, date in enumerate(dates):
-            # Get today's prices and weights
-            try:
-                today_data = data.loc[date]
-                today_signals = signals.loc[date]
-            except KeyError:
-                continue
-            
-            # Combine data and signals
-            if isinstance(today_data, pd.Series):
-                today_data = today_data.to_frame().T
-            if isinstance(today_signals, pd.Series):
-                today_signals = today_signals.to_frame().T
-            
-            combined = today_data.join(today_signals[['weight']], how='left')
-            combined['weight'] = combined['weight'].fillna(0.0)
-            
-            # Calculate current portfolio value
-            positions_value = 0.0
-            for ticker, (shares, _) in positions.items():
-                if ticker in combined.index:
-                    current_price = combined.loc[ticker, 'close']
-                    positions_value += shares * current_price
-            
-            portfolio_value = cash + positions_value
-            
-            # Rebalance portfolio
-            target_positions = {}
-            for ticker in combined.index:
-                weight = combined.loc[ticker, 'weight']
-                if weight > 0:
-                    target_value = portfolio_value * weight
-                    price = combined.loc[ticker, 'close']
-                    target_shares = target_value / (price * (1 + self.slippage))
-                    target_positions[ticker] = (target_shares, price)
-            
-            # Close positions not in target
-            for ticker in list(positions.keys()):
-                if ticker not in target_positions:
-                    shares, entry_price = positions[ticker]
-                    if ticker in combined.index:
-                        exit_price = combined.loc[ticker, 'close'] * (1 - self.slippage)
-                        cash += shares * exit_price * (1 - self.commission)
-                        
-                        # Record trade
-                        pnl = shares * (exit_price - entry_price)
-                        self.trades.append({
-                            'date': date,
-                            'ticker': ticker,
-                            'action': 'SELL',
-                            'shares': shares,
-                            'price': exit_price,
-                            'pnl': pnl
-                        })
-                    del positions[ticker]
-            
-            # Open/adjust positions in target
-            for ticker, (target_shares, entry_price) in target_positions.items():
-                current_shares = positions.get(ticker, (0, 0))[0]
-                shares_diff = target_shares - current_shares
-                
-                if abs(shares_diff) > 0.01:  # Minimum trade threshold
-                    trade_value = shares_diff * entry_price * (1 + self.slippage)
-                    commission_cost = abs(trade_value) * self.commission
-                    cash -= (trade_value + commission_cost)
-                    positions[ticker] = (target_shares, entry_price)
-                    
-                    # Record trade
-                    self.trades.append({
-                        'date': date,
-                        'ticker': ticker,
-                        'action': 'BUY' if shares_diff > 0 else 'SELL',
-                        'shares': abs(shares_diff),
-                        'price': entry_price,
-                        'pnl': 0.0
-                    })
-            
-            # Record daily equity
-            self.equity_curve.append({
-                'date': date,
-                'portfolio_value': portfolio_value,
-                'cash': cash,
-                'positions_value': positions_value,
-                'num_positions': len(positions)
-            })
-            
-            # Calculate daily return
-            if i > 0:
-                prev_value = self.equity_curve[i-1]['portfolio_value']
-                daily_return = (portfolio_value - prev_value) / prev_value
-                self.daily_returns.append(daily_return)
-            
-            # Store positions snapshot
-            self.positions_history.append({
-                'date': date,
-                'positions': positions.copy()
-            })
-        
-        # Convert to DataFrame
-        equity_df = pd.DataFrame(self.equity_curve)
-        equity_df = equity_df.set_index('date')
-        
-        print(f"\n✓ Backtest completed: {len(dates)} trading days")
+        closes, present = self._market_arrays(data)
+        equity_df, trades, holdings = self._simulate(data, signals, closes, present)
+        portfolio_values = equity_df['portfolio_value'].to_numpy()
+        n_days = len(equity_df)
+        
+        # Keep the trade/holding records as arrays; `trades` and
+        # `positions_history` label them on first access
+        self._runs.append((trades, holdings, equity_df.index, closes.tickers))
+        self._trades = self._positions_history = None
+        
+        # Daily returns between consecutive recorded days
+        self.equity_curve = equity_df
+        self.daily_returns = np.diff(portfolio_values) / portfolio_values[:-1]
+        
+        portfolio_value = portfolio_values[-1] if n_days else self.initial_capital
+        print(f"\n✓ Backtest completed: {n_days} trading days")
         print(f"  Final Portfolio Value: ${portfolio_value:,.2f}")
         print(f"  Total Return: {(portfolio_value/self.initial_capital - 1)*100:.2f}%")
-        print(f"  Number of Trades: {len(self.trades)}")
+        print(f"  Number of Trades: {len(self._trade_pnl())}")
         
         return equity_df
     
+    def run_batch(self,
+                  data: pd.DataFrame,
+                  signals_list: List[pd.DataFrame],
+                  max_workers: Optional[int] = None) -> List[pd.DataFrame]:
+        """
+        Backtest several signal sets on the same market data concurrently.
+        
+        Intended for parameter sweeps: the price matrix is built once and
+        shared, and each configuration runs the compiled day loop in its own
+        thread (the kernel releases the GIL). Costs and capital are this
+        engine's; results are returned only, without touching
+        `equity_curve`, `trades` or `positions_history`.
+        
+        Args:
+            data: Market data with MultiIndex (date, ticker)
+            signals_list: Signal DataFrames with 'weight' column, one per config
+            max_workers: Thread count (default: one per config, up to the CPU count)
+        
+        Returns:
+            List of equity curve DataFrames, in the order of signals_list
+        """
+        closes, present = self._market_arrays(data)
+        if max_workers is None:
+            max_workers = min(len(signals_list), os.cpu_count() or 1)
+        
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            results = list(executor.map(
+                lambda signals: self._simulate(data, signals, closes, present)[0],
+                signals_list
+            ))
+        
+        print(f"\n✓ Batch backtest completed: {len(results)} configurations")
+        
+        return results
+    
+    @staticmethod
+    def _market_arrays(data: pd.DataFrame) -> tuple:
+        """
+        Return the wide close matrix of data and its (date x ticker) presence mask.
+        
+        Args:
+            data: Market data with MultiIndex (date, ticker)
+        
+        Returns:
+            Tuple of (CloseMatrix, bool ndarray)
+        """
+        closes = close_matrix(data)
+        return closes, closes.present
+    
+    def _simulate(self,
+                  data: pd.DataFrame,
+                  signals: pd.DataFrame,
+                  closes: CloseMatrix,
+                  present: np.ndarray) -> tuple:
+        """
+        Run the compiled day loop for one signal set (no engine state is changed).
+        
+        Args:
+            data: Market data with MultiIndex (date, ticker)
+            signals: Signal DataFrame with 'weight' column
+            closes: close_matrix(data)
+            present: Presence mask of closes (see `_market_arrays`)
+        
+        Returns:
+            Tuple of (equity DataFrame, trades array, holdings array)
+        """
+        # Wide (date x ticker) weight matrix next to the shared price matrix,
+        # so the day loop only does positional NumPy indexing
+        dates = closes.dates
+        weights = np.zeros(closes.values.shape, dtype=np.float64)
+        weights[closes.row_date, closes.row_ticker] = self._align_weights(data, signals)
+        
+        # Days to simulate: dates with market data and at least one signal row
+        signal_codes, signal_dates = index_level(signals.index, 'date')
+        has_signals = dates.isin(signal_dates[np.unique(signal_codes)])
+        trading_days = np.flatnonzero(present.any(axis=1) & has_signals)
+        
+        # Compiled day loop (positions, trades and holdings as arrays)
+        equity, trades, holdings = simulate_rebalance(
+            closes.values, weights, present, trading_days,
+            float(self.initial_capital), float(self.commission), float(self.slippage)
+        )
+        n_days = len(trading_days)
+        holding_days = holdings[:, 0].astype(np.intp)
+        
+        # Wrap the filled buffers once
+        equity_df = pd.DataFrame({
+            'portfolio_value': equity[:, 0],
+            'cash': equity[:, 1],
+            'positions_value': equity[:, 2],
+            'num_positions': np.bincount(holding_days, minlength=n_days).astype(np.int32)
+        }, index=dates[trading_days].rename('date'))
+        
+        return equity_df, trades, holdings
+    
+    @staticmethod
+    def _align_weights(data: pd.DataFrame, signals: pd.DataFrame) -> np.ndarray:
+        """
+        Return signals['weight'] aligned to the rows of data (missing -> 0).
+        
+        Args:
+            data: Market data with MultiIndex (date, ticker)
+            signals: Signal DataFrame with 'weight' column
+        
+        Returns:
+            float64 array with one weight per row of data
+        """
+        weight = signals['weight']
+        if not weight.index.equals(data.index):
+            weight = weight.reindex(data.index)
+        return weight.fillna(0.0).to_numpy(dtype=np.float64)
+    
     def get_performance_metrics(self) -> Dict:
         """Calculate comprehensive performance metrics."""
         if len(self.daily_returns) == 0:
             return {"error": "No backtest results available"}
         
-        returns = pd.Series(self.daily_returns)
-        equity = pd.DataFrame(self.equity_curve)
+        equity = self.equity_curve
+        portfolio_values = equity['portfolio_value'].to_numpy()
+        
+        # Return volatility and maximum drawdown from one compiled pass
+        # over the equity curve
+        daily_vol, max_drawdown = equity_stats(portfolio_values)
         
         # Basic metrics
-        total_return = (equity['portfolio_value'].iloc[-1] / self.initial_capital) - 1
+        total_return = (portfolio_values[-1] / self.initial_capital) - 1
         
         # Annualized metrics (assuming 252 trading days)
-        annualized_return = (1 + total_return) ** (252 / len(returns)) - 1
-        annualized_vol = returns.std() * np.sqrt(252)
+        annualized_return = (1 + total_return) ** (252 / len(self.daily_returns)) - 1
+        annualized_vol = daily_vol * np.sqrt(252)
         
         # Sharpe Ratio (assuming 0% risk-free rate)
         sharpe_ratio = annualized_return / annualized_vol if annualized_vol > 0 else 0
         
-        # Maximum Drawdown
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = drawdown.min()
-        
         # Win rate
-        winning_trades = [t for t in self.trades if t.get('pnl', 0) > 0]
-        win_rate = len(winning_trades) / len(self.trades) if len(self.trades) > 0 else 0
+        pnl = self._trade_pnl()
+        win_rate = np.count_nonzero(pnl > 0) / len(pnl) if len(pnl) > 0 else 0
         
         metrics = {
             'Total Return': f"{total_return*100:.2f}%",
@@ -212,31 +272,33 @@ class BacktestEngine:
             'Sharpe Ratio': f"{sharpe_ratio:.3f}",
             'Maximum Drawdown': f"{max_drawdown*100:.2f}%",
             'Win Rate': f"{win_rate*100:.2f}%",
-            'Total Trades': len(self.trades),
+            'Total Trades': len(pnl),
             'Avg Positions': equity['num_positions'].mean(),
-            'Final Value': f"${equity['portfolio_value'].iloc[-1]:,.2f}"
+            'Final Value': f"${portfolio_values[-1]:,.2f}"
         }
         
         return metrics
     
-    def plot_results(self, save_path: Optional[str] = None):
+    def plot_results(self, save_path: Optional[str] = None, dpi: int = 100):
         """
         Plot backtest results with equity curve and drawdown.
         
         Args:
             save_path: Optional path to save the figure
+            dpi: Resolution of the saved figure
         """
         if len(self.equity_curve) == 0:
             print("No results to plot")
             return
         
-        equity_df = pd.DataFrame(self.equity_curve).set_index('date')
-        returns = pd.Series(self.daily_returns)
+        # Imported here: matplotlib is only needed for plotting, and loading
+        # it at module import slowed down every BacktestEngine import
+        import matplotlib.pyplot as plt
+        
+        equity_df = self.equity_curve
         
-        # Calculate drawdown
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
+        # Calculate drawdown (one value per daily return)
+        drawdown = equity_drawdown(equity_df['portfolio_value'].to_numpy())[1:]
         
         # Create figure
         fig, axes = plt.subplots(3, 1, figsize=(14, 10))
@@ -271,7 +333,7 @@ class BacktestEngine:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
             print(f"✓ Results saved to: {save_path}")
         else:
             plt.show()
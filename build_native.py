@@ -0,0 +1,48 @@
+"""
+Build Native Kernels (Ahead-of-Time)
+====================================
+Compiles selected kernels from numba_kernels.py into a `_native` extension
+module with numba.pycc, so the dashboard can import machine code directly
+instead of JIT-compiling on the first "Run Backtest" click.
+
+Usage:
+    python build_native.py
+
+The extension is optional: numba_kernels.py uses it when importable and
+otherwise falls back to the JIT (or pure NumPy) kernels. Rebuild after
+changing an exported kernel. Requires numba at build time only.
+"""
+
+import os
+
+from numba.pycc import CC
+
+import numba_kernels
+
+
+# Kernel name -> AOT signature (exported functions have fixed types)
+EXPORTS = {
+    'drawdown': 'f8[:](f8[:])',
+}
+
+
+def build(output_dir: str = None):
+    """
+    Compile the exported kernels into the `_native` extension module.
+
+    Args:
+        output_dir: Where to write the extension (default: next to this file)
+    """
+    cc = CC('_native')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+
+    for name, signature in EXPORTS.items():
+        cc.export(name, signature)(getattr(numba_kernels, name).py_func)
+
+    print(f"Compiling {', '.join(EXPORTS)} -> {cc.output_dir}")
+    cc.compile()
+    print("✅ _native extension built")
+
+
+if __name__ == "__main__":
+    build()
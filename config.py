@@ -7,18 +7,30 @@ Modify these settings to customize behavior without changing code.
 
 from dataclasses import dataclass, field
 from typing import List, Optional
+import functools
 import os
 from dotenv import load_dotenv
 
+# Streamlit is only needed for its secrets (cloud deployment); checked once
+try:
+    import streamlit as st
+    _HAS_STREAMLIT = True
+except ImportError:
+    _HAS_STREAMLIT = False
+
 # Load environment variables from .env file
 load_dotenv()
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_value(key: str, default: str = None, streamlit_section: str = None) -> Optional[str]:
     """
     Get configuration value from Streamlit secrets or environment variables.
     Prioritizes Streamlit secrets when available (for cloud deployment).
     
+    Each (key, default, section) is resolved once per process, so building
+    an AWSConfig on every Streamlit rerun does not re-probe the secrets.
+    
     Args:
         key: Environment variable key
         default: Default value if not found
@@ -29,8 +41,7 @@ def get_config_value(key: str, default: str = None, streamlit_section: str = Non
     """
     # Try Streamlit secrets first (for cloud deployment)
     try:
-        import streamlit as st
-        if hasattr(st, 'secrets'):
+        if _HAS_STREAMLIT and hasattr(st, 'secrets'):
             # Try to access the secret with section
             if streamlit_section:
                 try:
@@ -46,7 +57,7 @@ def get_config_value(key: str, default: str = None, streamlit_section: str = Non
                     return st.secrets[key]
             except (KeyError, AttributeError):
                 pass
-    except (ImportError, FileNotFoundError, AttributeError):
+    except (FileNotFoundError, AttributeError):
         pass
     
     # Fall back to environment variables (for local development)
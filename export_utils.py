@@ -0,0 +1,27 @@
+"""
+Export Helpers
+==============
+Lightweight serialization helpers shared by the dashboard pages.
+"""
+
+import io
+
+import pandas as pd
+
+
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes for a download button.
+    
+    Rows are written in chunks into a byte buffer instead of one large
+    intermediate str.
+    
+    Args:
+        df: DataFrame to export (index included)
+    
+    Returns:
+        CSV file contents
+    """
+    buffer = io.BytesIO()
+    df.to_csv(buffer, chunksize=10000, encoding='utf-8')
+    return buffer.getvalue()
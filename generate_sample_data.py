@@ -6,8 +6,16 @@ Creates a synthetic NASDAQ dataset for testing the Streamlit dashboard.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from datetime import datetime
 
+# Optional: scipy runs the AR(1) recurrence as a compiled linear filter
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
 def generate_nasdaq_csv(
     filename: str = "NASDAQ.csv",
     num_tickers: int = 20,
@@ -24,7 +32,8 @@ def generate_nasdaq_csv(
         seed: Random seed for reproducibility
     """
     
-    np.random.seed(seed)
+    # Local PCG64 generator: reproducible without touching global np.random state
+    rng = np.random.default_rng(seed)
     
     print(f"Generating {filename}...")
     print(f"  Tickers: {num_tickers}")
@@ -39,62 +48,65 @@ def generate_nasdaq_csv(
     
     # Select tickers
     selected_tickers = nasdaq_tickers[:num_tickers]
+    n_tickers = len(selected_tickers)
     
     # Generate dates (business days)
     dates = pd.date_range(start='2022-01-01', periods=num_days, freq='B')
     
-    data = []
+    # Unique characteristics for each stock, shape (n_tickers,)
+    drifts = rng.uniform(-0.0003, 0.0008, n_tickers)  # Daily return
+    volatilities = rng.uniform(0.015, 0.035, n_tickers)  # Daily volatility
+    initial_prices = rng.uniform(50, 500, n_tickers)
+    ar_coefficients = rng.uniform(0.2, 0.5, n_tickers)
+    
+    # Generate all price series at once using Geometric Brownian Motion,
+    # shape (n_tickers, num_days)
+    returns = rng.normal(drifts[:, None], volatilities[:, None], (n_tickers, num_days))
+    
+    # Add mean reversion: returns[i] -= ar * returns[i-1] (recursive in time),
+    # i.e. the IIR filter y[i] = x[i] - ar * y[i-1]
+    if lfilter is not None:
+        for row, ar in zip(returns, ar_coefficients):
+            row[:] = lfilter([1.0], [1.0, ar], row)
+    else:
+        for i in range(1, num_days):
+            returns[:, i] += -ar_coefficients * returns[:, i-1]
+    
+    # Convert to prices
+    closes = initial_prices[:, None] * np.exp(np.cumsum(returns, axis=1))
+    
+    # Realistic OHLC generation
+    opens = closes * rng.uniform(0.99, 1.01, closes.shape)
+    highs = np.maximum(opens, closes) * rng.uniform(1.0, 1.02, closes.shape)
+    lows = np.minimum(opens, closes) * rng.uniform(0.98, 1.0, closes.shape)
     
-    for ticker in selected_tickers:
-        # Unique characteristics for each stock
-        drift = np.random.uniform(-0.0003, 0.0008)  # Daily return
-        volatility = np.random.uniform(0.015, 0.035)  # Daily volatility
-        initial_price = np.random.uniform(50, 500)
-        
-        # Generate price series using Geometric Brownian Motion
-        returns = np.random.normal(drift, volatility, num_days)
-        
-        # Add mean reversion
-        ar_coefficient = np.random.uniform(0.2, 0.5)
-        for i in range(1, len(returns)):
-            returns[i] += -ar_coefficient * returns[i-1]
-        
-        # Convert to prices
-        prices = initial_price * np.exp(np.cumsum(returns))
-        
-        # Generate OHLCV for each day
-        for i, (date, close) in enumerate(zip(dates, prices)):
-            daily_vol = volatility * close
-            
-            # Realistic OHLC generation
-            open_price = close * np.random.uniform(0.99, 1.01)
-            high_price = max(open_price, close) * np.random.uniform(1.0, 1.02)
-            low_price = min(open_price, close) * np.random.uniform(0.98, 1.0)
-            
-            # Volume with realistic patterns (higher on volatile days)
-            base_volume = np.random.uniform(5e6, 20e6)
-            volume_multiplier = 1 + abs(returns[i]) * 50
-            volume = int(base_volume * volume_multiplier)
-            
-            data.append({
-                'Date': date.strftime('%Y-%m-%d'),
-                'Ticker': ticker,
-                'Open': round(open_price, 2),
-                'High': round(high_price, 2),
-                'Low': round(low_price, 2),
-                'Close': round(close, 2),
-                'Volume': volume
-            })
+    # Volume with realistic patterns (higher on volatile days)
+    base_volumes = rng.uniform(5e6, 20e6, closes.shape)
+    volumes = (base_volumes * (1 + np.abs(returns) * 50)).astype(np.int64)
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    # Arrow table from flat (ticker-major) column arrays; dates stay date32
+    # (written as YYYY-MM-DD) instead of per-row formatted strings
+    table = pa.table({
+        'Date': np.tile(dates.values.astype('datetime64[D]'), n_tickers),
+        'Ticker': np.repeat(selected_tickers, num_days),
+        'Open': np.round(opens, 2).ravel(),
+        'High': np.round(highs, 2).ravel(),
+        'Low': np.round(lows, 2).ravel(),
+        'Close': np.round(closes, 2).ravel(),
+        'Volume': volumes.ravel()
+    })
     
-    # Save to CSV
-    df.to_csv(filename, index=False)
+    # Save to CSV with Arrow's multithreaded writer (unquoted header and values)
+    with open(filename, 'wb') as f:
+        f.write((','.join(table.column_names) + '\n').encode())
+        pa_csv.write_csv(
+            table, f,
+            write_options=pa_csv.WriteOptions(include_header=False, quoting_style='none')
+        )
     
     print(f"✅ Successfully generated {filename}")
-    print(f"   Total rows: {len(df):,}")
-    print(f"   Date range: {df['Date'].min()} to {df['Date'].max()}")
+    print(f"   Total rows: {table.num_rows:,}")
+    print(f"   Date range: {dates[0].date()} to {dates[-1].date()}")
     print(f"   Tickers: {', '.join(selected_tickers[:5])}{'...' if len(selected_tickers) > 5 else ''}")
     print()
     print("You can now run the Streamlit dashboard:")
@@ -18,15 +18,74 @@ warnings.filterwarnings('ignore')
 load_dotenv()
 
 # Import our modular components
-from strategy_base import Strategy
+from strategy_base import Strategy, level_max
 from mean_reversion_strategy import MeanReversionQP
 from trend_strategy import SimpleTrend
 from portfolio_manager import PortfolioManager, PortfolioConfig
 from backtest_engine import BacktestEngine
-from s3_data_loader import S3DataLoader
+from s3_data_loader import S3DataLoader, DATE_FORMAT, downcast_ohlcv
 from config import AWSConfig
 
 
+# Parquet copy of the parsed local CSV (MultiIndex frame). The suffix is
+# only written here, so the dashboard's and S3 loader's caches never collide
+PARSED_CACHE_SUFFIX = '.main.parquet'
+PARSED_CACHE_VERSION = 1  # Bump whenever the parsed frame layout changes
+
+
+def parsed_cache_paths(filepath: str) -> tuple:
+    """Return (parquet_path, meta_path) of the parsed-data cache for a CSV file."""
+    parquet_path = os.path.splitext(filepath)[0] + PARSED_CACHE_SUFFIX
+    return parquet_path, parquet_path + '.meta'
+
+
+def read_parsed_cache(filepath: str):
+    """
+    Read the parsed frame cached for a CSV file, if still valid.
+    
+    The cache is used only while its recorded layout version and CSV
+    modification time match, and it holds the expected index and columns.
+    
+    Args:
+        filepath: Path to the source CSV file
+    
+    Returns:
+        DataFrame with MultiIndex (date, ticker) and OHLCV columns, or None
+    """
+    parquet_path, meta_path = parsed_cache_paths(filepath)
+    
+    try:
+        with open(meta_path) as f:
+            cached_version, cached_mtime = f.read().split()
+        if (int(cached_version) != PARSED_CACHE_VERSION
+                or float(cached_mtime) != os.path.getmtime(filepath)):
+            return None
+        df = pd.read_parquet(parquet_path, engine='pyarrow')
+    except (OSError, ValueError):
+        return None
+    
+    if (list(df.index.names) != ['date', 'ticker']
+            or list(df.columns) != ['open', 'high', 'low', 'close', 'volume']):
+        return None
+    
+    return downcast_ohlcv(df)
+
+
+def write_parsed_cache(filepath: str, df: pd.DataFrame):
+    """
+    Persist a parsed frame next to its CSV file (best effort: e.g. a
+    read-only directory just skips the cache).
+    """
+    parquet_path, meta_path = parsed_cache_paths(filepath)
+    
+    try:
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd')
+        with open(meta_path, 'w') as f:
+            f.write(f"{PARSED_CACHE_VERSION} {os.path.getmtime(filepath)!r}")
+    except OSError:
+        pass
+
+
 def load_live_market_data(
     filepath: str = "NASDAQ_HISTORY_2.csv",
     use_s3: bool = None
@@ -68,21 +127,23 @@ def load_live_market_data(
                 use_cache=aws_config.use_cache
             )
             
-            return df
+            return downcast_ohlcv(df)
             
         else:
             # Load from local file
             print(f"📁 Loading from local file: {filepath}")
             
-            # Load CSV
-            df = pd.read_csv(filepath)
-            
-            # Standardize column names (lowercase)
-            df.columns = df.columns.str.lower()
+            # Reuse the Parquet copy of a previous run unless the CSV changed
+            df = read_parsed_cache(filepath)
+            if df is not None:
+                print(f"📦 Loaded parsed data from cache: {parsed_cache_paths(filepath)[0]}")
+                print(f"   Total Records: {len(df):,}")
+                return df
             
-            # Rename columns to match expected format
+            # Rename columns to match expected format (matched case-insensitively)
             column_mapping = {
                 'code': 'ticker',
+                'ticker': 'ticker',
                 'date': 'date',
                 'open': 'open',
                 'high': 'high',
@@ -90,21 +151,55 @@ def load_live_market_data(
                 'close': 'close',
                 'volume': 'volume'
             }
+            
+            # Load CSV: read the header first so only the needed columns are
+            # parsed, by the multithreaded Arrow CSV reader (which also
+            # parses YYYY-MM-DD dates natively)
+            header = pd.read_csv(filepath, nrows=0).columns
+            usecols = [col for col in header if col.lower() in column_mapping]
+            ticker_col = next((col for col in usecols if column_mapping[col.lower()] == 'ticker'), None)
+            df = pd.read_csv(
+                filepath,
+                engine='pyarrow',
+                usecols=usecols,
+                dtype={ticker_col: 'category'} if ticker_col else None
+            )
+            
+            # Standardize column names (lowercase)
+            df.columns = df.columns.str.lower()
             df = df.rename(columns=column_mapping)
             
-            # Convert date to datetime (YYYY-MM-DD format)
-            df['date'] = pd.to_datetime(df['date'])
+            # Convert date to datetime if the reader left it as text
+            # (YYYY-MM-DD format; explicit format skips per-element
+            # inference, cache parses each date once)
+            if not pd.api.types.is_datetime64_any_dtype(df['date']):
+                df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, cache=True)
             
             # Keep only required columns
             required_cols = ['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']
             df = df[required_cols]
             
-            # Set MultiIndex
-            df = df.set_index(['date', 'ticker']).sort_index()
+            # Downcast OHLCV (float32 prices, uint32 volume)
+            df = downcast_ohlcv(df)
+            
+            # Store ticker as a categorical (int codes + one array of unique
+            # tickers instead of a Python str per row) with string labels
+            if not isinstance(df['ticker'].dtype, pd.CategoricalDtype):
+                df['ticker'] = df['ticker'].astype('category')
+            if not pd.api.types.is_string_dtype(df['ticker'].cat.categories):
+                df['ticker'] = df['ticker'].cat.rename_categories(str)
+            
+            # Set MultiIndex (sorting skipped when the CSV is already in date/ticker order)
+            df = df.set_index(['date', 'ticker'])
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
             
             # Remove any duplicates
             df = df[~df.index.duplicated(keep='first')]
             
+            # Persist the parsed frame so the next run skips CSV parsing
+            write_parsed_cache(filepath, df)
+            
             print(f"\n📊 Data Summary:")
             print(f"   Date Range: {df.index.get_level_values('date').min()} to {df.index.get_level_values('date').max()}")
             print(f"   Unique Tickers: {df.index.get_level_values('ticker').nunique()}")
@@ -251,7 +346,7 @@ def main():
     print(f"Std Combined Score: {summary['std_combined_score']:.4f}")
     
     # Show example of top assets for last date
-    last_date = ensemble_signals.index.get_level_values('date').unique()[-1]
+    last_date = level_max(ensemble_signals.index, 'date')
     print(f"\n{'─'*60}")
     print(f"TOP ASSETS ON LAST DAY ({last_date.date()})")
     print(f"{'─'*60}")
@@ -6,7 +6,8 @@ Mean Reversion Strategy (Murphy's Law Principle)
 
 import pandas as pd
 import numpy as np
-from strategy_base import Strategy
+from strategy_base import Strategy, close_matrix
+from numba_kernels import qpi_features_2d, rank_pct_rows
 
 
 class MeanReversionQP(Strategy):
@@ -47,44 +48,51 @@ class MeanReversionQP(Strategy):
         Returns:
             DataFrame with 'signal' column: +1.0 (strong buy) to -1.0 (strong sell)
         """
-        df = data.copy()
-        
-        # Calculate Moving Average
-        df['ma'] = df.groupby(level='ticker')['close'].transform(
-            lambda x: x.rolling(self.lookback_ma, min_periods=1).mean()
-        )
-        
-        # Calculate Recent Volatility (standard deviation of returns)
-        df['returns'] = df.groupby(level='ticker')['close'].pct_change()
-        df['recent_vol'] = df.groupby(level='ticker')['returns'].transform(
-            lambda x: x.rolling(self.lookback_vol, min_periods=1).std()
+        # Moving Average, Recent Volatility (std of returns) and Historical
+        # Volatility baseline, computed column-wise on the shared wide close
+        # matrix in one compiled pass (windows and returns over each
+        # ticker's own rows, so dates a ticker lacks are skipped)
+        closes = close_matrix(data)
+        ma, recent_vol, historical_vol = qpi_features_2d(
+            closes.values,
+            closes.present,
+            self.lookback_ma,
+            self.lookback_vol,
+            self.historical_vol_period
         )
         
-        # Calculate Historical Volatility (long-term baseline)
-        df['historical_vol'] = df.groupby(level='ticker')['returns'].transform(
-            lambda x: x.rolling(self.historical_vol_period, min_periods=self.lookback_vol).mean()
-        )
-        
-        # Quality-Price Indicator (QPI)
-        df['price_ratio'] = df['close'] / df['ma']
-        df['vol_ratio'] = df['recent_vol'] / (df['historical_vol'] + 1e-8)  # Avoid division by zero
-        df['qpi'] = df['price_ratio'] * df['vol_ratio']
-        
-        # Generate signals: Inverse of QPI (low QPI = strong buy)
-        # Normalize QPI to [-1, 1] using percentile ranks within each date
-        df['qpi_rank'] = df.groupby(level='date')['qpi'].rank(pct=True)
+        # Quality-Price Indicator (QPI), normalized to [-1, 1] using
+        # percentile ranks within each date. With one row per (date, ticker)
+        # cell everything stays on the wide matrices and only the ranks and
+        # volatility ratio are gathered back to the input rows
+        if closes.unique_cells:
+            vol_ratio_matrix = recent_vol / (historical_vol + 1e-8)  # Avoid division by zero
+            qpi_matrix = closes.values / ma * vol_ratio_matrix
+            qpi_rank = closes.to_long(rank_pct_rows(qpi_matrix))
+            vol_ratio = closes.to_long(vol_ratio_matrix)
+        else:
+            close = data['close'].to_numpy(dtype=np.float64)
+            price_ratio = close / closes.to_long(ma)
+            vol_ratio = closes.to_long(recent_vol) / (closes.to_long(historical_vol) + 1e-8)
+            qpi = pd.Series(price_ratio * vol_ratio, index=data.index)
+            qpi_rank = qpi.groupby(level='date').rank(pct=True).to_numpy()
         
         # Invert and scale: low QPI (rank close to 0) -> signal close to +1
-        df['signal'] = 1.0 - 2.0 * df['qpi_rank']  # Maps [0, 1] to [1, -1]
+        signal = 1.0 - 2.0 * qpi_rank  # Maps [0, 1] to [1, -1]
         
         # Handle NaN values
-        df['signal'] = df['signal'].fillna(0.0)
+        signal[np.isnan(signal)] = 0.0
         
         # Confidence: inverse of volatility ratio (stable = high confidence)
-        df['confidence'] = 1.0 / (1.0 + df['vol_ratio'])
-        df['confidence'] = df['confidence'].fillna(0.5)
+        confidence = 1.0 / (1.0 + vol_ratio)
+        confidence[np.isnan(confidence)] = 0.5
         
-        return df[['signal', 'confidence']]
+        # Build the output directly on data.index (no copy of the input frame)
+        return pd.DataFrame(
+            {'signal': signal, 'confidence': confidence},
+            index=data.index,
+            copy=False
+        )
     
     def __repr__(self) -> str:
         return (f"MeanReversionQP(name='{self.name}', "
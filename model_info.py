@@ -0,0 +1,180 @@
+"""
+Model Metadata
+==============
+Descriptions and hyperparameter documentation for the dashboard's models.
+
+Streamlit re-executes app.py on every rerun; as an imported module this
+table is built once per process and shared read-only (frozen, slotted
+dataclasses behind a MappingProxyType).
+
+Strategy classes are referenced by import path and only imported when
+`strategy_class` is read, so pages that just display this table never load
+the strategy modules (and their compiled kernels).
+"""
+
+import importlib
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Hyperparam:
+    """Documentation of one strategy hyperparameter."""
+    name: str
+    description: str
+    default: int
+    range: Tuple[int, int]
+    impact: str
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSpec:
+    """Description, assumptions and hyperparameters of one model."""
+    strategy_path: str  # "module:ClassName"
+    short_desc: str
+    description: str
+    assumptions: Tuple[str, ...]
+    hyperparameters: Mapping[str, Hyperparam]
+    
+    @property
+    def strategy_class(self) -> type:
+        """Strategy class of this model (its module is imported on first use)."""
+        module_name, class_name = self.strategy_path.split(':')
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+MODEL_INFO: Mapping[str, ModelSpec] = MappingProxyType({
+    "Mean Reversion": ModelSpec(
+        strategy_path="mean_reversion_strategy:MeanReversionQP",
+        short_desc="Buys undervalued assets when price deviates below historical mean, assuming reversion to equilibrium.",
+        description="""
+        **Mean Reversion (Quality-Price Indicator)**
+        
+        This strategy identifies undervalued assets by calculating a Quality-Price Indicator (QPI) 
+        that measures how far current prices deviate from their historical average relative to volatility.
+        
+        **Core Logic:**
+        - Calculates moving average and volatility over lookback periods
+        - Computes QPI = (Price - MA) / Historical Volatility
+        - Generates buy signals when QPI is low (price below mean)
+        - Assumes prices will revert to the mean over time
+        
+        **Best Use Cases:**
+        - Range-bound markets with clear support/resistance
+        - Assets with stable fundamental values
+        - Markets with cyclical behavior
+        """,
+        assumptions=(
+            "Asset prices oscillate around a stable mean",
+            "Volatility is relatively constant over time",
+            "No structural breaks or regime changes",
+            "Sufficient liquidity for mean reversion to occur"
+        ),
+        hyperparameters=MappingProxyType({
+            "lookback_ma": Hyperparam(
+                name="MA Lookback Period",
+                description="Number of periods to calculate moving average",
+                default=50,
+                range=(20, 200),
+                impact="Shorter = more responsive to price changes, Longer = smoother trend"
+            ),
+            "lookback_vol": Hyperparam(
+                name="Volatility Lookback Period",
+                description="Number of periods to calculate volatility",
+                default=20,
+                range=(10, 60),
+                impact="Affects sensitivity to price deviations"
+            ),
+            "historical_vol_period": Hyperparam(
+                name="Historical Volatility Period",
+                description="Extended period for calculating baseline volatility",
+                default=100,
+                range=(50, 500),
+                impact="Longer period = more stable volatility estimates"
+            )
+        })
+    ),
+    
+    "Trend Following": ModelSpec(
+        strategy_path="trend_strategy:SimpleTrend",
+        short_desc="Follows momentum by comparing price to moving average, buying when price is above trend.",
+        description="""
+        **Simple Trend Following Strategy**
+        
+        This strategy captures momentum by identifying assets trading above their moving average,
+        indicating an established uptrend.
+        
+        **Core Logic:**
+        - Calculates Simple Moving Average (SMA) over specified period
+        - Compares current price to SMA
+        - Generates buy signals when price > SMA (uptrend)
+        - Signal strength based on distance from SMA
+        
+        **Best Use Cases:**
+        - Trending markets with clear directional moves
+        - Breakout scenarios
+        - Momentum-driven assets (tech stocks, growth sectors)
+        """,
+        assumptions=(
+            "Trends persist over time (momentum effect)",
+            "Price above MA indicates continued upward movement",
+            "Market exhibits trending behavior vs. mean reversion",
+            "Transaction costs don't erode trend profits"
+        ),
+        hyperparameters=MappingProxyType({
+            "sma_period": Hyperparam(
+                name="SMA Period",
+                description="Number of periods for moving average calculation",
+                default=100,
+                range=(20, 200),
+                impact="Shorter = captures short-term trends, Longer = focuses on major trends"
+            )
+        })
+    ),
+    
+    "Momentum": ModelSpec(
+        strategy_path="momentum_strategy:MomentumStrategy",
+        short_desc="Ranks assets by recent price performance, buying strongest performers expecting continuation.",
+        description="""
+        **Momentum Strategy (Rate of Change)**
+        
+        This strategy selects assets with the strongest recent price performance,
+        based on the principle that past winners tend to continue winning.
+        
+        **Core Logic:**
+        - Calculates rate of change over lookback period
+        - Ranks assets by momentum score
+        - Generates signals favoring top performers
+        - Continuous rebalancing to maintain momentum exposure
+        
+        **Best Use Cases:**
+        - Bull markets with clear sector leaders
+        - Growth-oriented portfolios
+        - High-volatility environments with persistent trends
+        """,
+        assumptions=(
+            "Past performance predicts future performance (short-term)",
+            "Winner momentum persists for the holding period",
+            "Market rewards risk-taking in uptrends",
+            "Sufficient liquidity to enter/exit positions"
+        ),
+        hyperparameters=MappingProxyType({
+            "lookback_period": Hyperparam(
+                name="Momentum Lookback Period",
+                description="Number of periods to calculate momentum",
+                default=20,
+                range=(5, 60),
+                impact="Shorter = more reactive to recent changes, Longer = more stable signals"
+            )
+        })
+    )
+})
+
+
+# "Best Use Cases" section of each description, extracted once for the
+# Models overview
+BEST_FOR: Mapping[str, str] = MappingProxyType({
+    name: spec.description.split('**Best Use Cases:**')[1].split('**')[0].strip()
+    for name, spec in MODEL_INFO.items()
+})
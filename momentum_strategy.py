@@ -43,22 +43,30 @@ class MomentumStrategy(Strategy):
         Returns:
             DataFrame with 'signal' column: +1.0 (strong momentum) to -1.0 (weak momentum)
         """
-        df = data.copy()
-        
         # Calculate momentum (return over lookback period)
-        df['momentum'] = df.groupby(level='ticker')['close'].pct_change(self.lookback)
+        momentum = (
+            data['close'].astype(np.float64)
+            .groupby(level='ticker', observed=True)
+            .pct_change(self.lookback)
+            .to_numpy()
+        )
         
         # Normalize using tanh (maps to [-1, 1])
-        df['signal'] = np.tanh(df['momentum'] * 10)  # 10 is sensitivity factor
+        signal = np.tanh(momentum * 10)  # 10 is sensitivity factor
         
         # Handle NaN values
-        df['signal'] = df['signal'].fillna(0.0)
+        signal[np.isnan(signal)] = 0.0
         
         # Confidence: based on absolute momentum (strong moves = high confidence)
-        df['confidence'] = np.abs(df['momentum']).clip(0, 0.5) / 0.5
-        df['confidence'] = df['confidence'].fillna(0.5)
+        confidence = np.clip(np.abs(momentum), 0, 0.5) / 0.5
+        confidence[np.isnan(confidence)] = 0.5
         
-        return df[['signal', 'confidence']]
+        # Build the output directly on data.index (no copy of the input frame)
+        return pd.DataFrame(
+            {'signal': signal, 'confidence': confidence},
+            index=data.index,
+            copy=False
+        )
     
     def __repr__(self) -> str:
         return f"MomentumStrategy(name='{self.name}', lookback={self.lookback})"
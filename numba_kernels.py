@@ -0,0 +1,603 @@
+"""
+Numba Kernels
+=============
+JIT-compiled inner loops for the strategy and backtest hot paths.
+
+Numba is an optional dependency: when it is not installed, `njit` is a
+no-op decorator and the kernels run as plain Python (same results, slower).
+
+Kernels are compiled with nogil=True so strategies can run them from
+worker threads concurrently. Each one is compiled on first call, only for
+the argument types it actually receives (e.g. float32 prices from the
+loaders, float64 equity curves), and with cache=True loaded from
+__pycache__ on later runs instead of JIT-compiling again. Importing this
+module compiles nothing.
+Kernels listed in build_native.py can also be compiled ahead of time into a
+`_native` extension, which is used in preference when importable.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean(values, window, min_periods):
+    """
+    Trailing rolling mean with O(1) sliding sums.
+
+    Matches pandas `Series.rolling(window, min_periods).mean()`: NaNs are
+    skipped and windows with fewer than `min_periods` valid values are NaN.
+
+    Args:
+        values: 1-D float array
+        window: Window length
+        min_periods: Minimum number of valid observations per window
+
+    Returns:
+        float64 array of the same length
+    """
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+    count = 0
+
+    for i in range(n):
+        x = values[i]
+        if not np.isnan(x):
+            total += x
+            count += 1
+        if i >= window:
+            old = values[i - window]
+            if not np.isnan(old):
+                total -= old
+                count -= 1
+        out[i] = total / count if count >= min_periods and count > 0 else np.nan
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def qpi_features(close, lookback_ma, lookback_vol, historical_vol_period):
+    """
+    Single-pass Quality-Price Indicator inputs for one ticker.
+
+    Computes, in one sweep over the price series, the equivalent of:
+        ma             = close.rolling(lookback_ma, min_periods=1).mean()
+        returns        = close.pct_change()
+        recent_vol     = returns.rolling(lookback_vol, min_periods=1).std()
+        historical_vol = returns.rolling(historical_vol_period,
+                                         min_periods=lookback_vol).mean()
+
+    Args:
+        close: 1-D float array of closing prices (chronological)
+        lookback_ma: Moving average window
+        lookback_vol: Recent volatility window
+        historical_vol_period: Historical baseline window
+
+    Returns:
+        Tuple of float64 arrays (ma, recent_vol, historical_vol)
+    """
+    n = close.shape[0]
+    returns = np.empty(n, dtype=np.float64)
+    ma = np.empty(n, dtype=np.float64)
+    recent_vol = np.empty(n, dtype=np.float64)
+    historical_vol = np.empty(n, dtype=np.float64)
+
+    ma_sum = 0.0
+    ma_count = 0
+    vol_sum = 0.0
+    vol_sumsq = 0.0
+    vol_count = 0
+    hist_sum = 0.0
+    hist_count = 0
+
+    for i in range(n):
+        c = close[i]
+        r = close[i] / close[i - 1] - 1.0 if i > 0 else np.nan
+        returns[i] = r
+
+        # Moving average of price
+        if not np.isnan(c):
+            ma_sum += c
+            ma_count += 1
+        if i >= lookback_ma:
+            old = close[i - lookback_ma]
+            if not np.isnan(old):
+                ma_sum -= old
+                ma_count -= 1
+        ma[i] = ma_sum / ma_count if ma_count > 0 else np.nan
+
+        # Rolling sample standard deviation of returns
+        if not np.isnan(r):
+            vol_sum += r
+            vol_sumsq += r * r
+            vol_count += 1
+        if i >= lookback_vol:
+            old = returns[i - lookback_vol]
+            if not np.isnan(old):
+                vol_sum -= old
+                vol_sumsq -= old * old
+                vol_count -= 1
+        if vol_count > 1:
+            var = (vol_sumsq - vol_sum * vol_sum / vol_count) / (vol_count - 1)
+            recent_vol[i] = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            recent_vol[i] = np.nan
+
+        # Long-horizon baseline of returns
+        if not np.isnan(r):
+            hist_sum += r
+            hist_count += 1
+        if i >= historical_vol_period:
+            old = returns[i - historical_vol_period]
+            if not np.isnan(old):
+                hist_sum -= old
+                hist_count -= 1
+        if hist_count >= lookback_vol and hist_count > 0:
+            historical_vol[i] = hist_sum / hist_count
+        else:
+            historical_vol[i] = np.nan
+
+    return ma, recent_vol, historical_vol
+
+
+@njit(cache=True, nogil=True)
+def _present_rows(values, present, j):
+    """
+    Row positions of the cells present in column j and their values.
+
+    The rolling windows of a ticker run over its own rows (as a per-ticker
+    groupby would), so dates the ticker has no row for are skipped instead
+    of entering its windows as NaN.
+    """
+    rows = np.flatnonzero(present[:, j])
+    column = np.empty(rows.shape[0], dtype=values.dtype)
+    for k in range(rows.shape[0]):
+        column[k] = values[rows[k], j]
+    return rows, column
+
+
+@njit(cache=True, nogil=True)
+def rolling_mean_2d(values, present, window, min_periods):
+    """
+    Column-wise `rolling_mean` over a (date x ticker) matrix.
+
+    Args:
+        values: 2-D float array, one column per ticker (chronological rows)
+        present: Bool matrix of the cells backed by an input row
+        window: Window length (in the ticker's own rows)
+        min_periods: Minimum number of valid observations per window
+
+    Returns:
+        float64 matrix of the same shape (Fortran order), NaN where not present
+    """
+    n_dates, n_tickers = values.shape
+    out = np.full((n_tickers, n_dates), np.nan).T
+
+    for j in range(n_tickers):
+        rows, column = _present_rows(values, present, j)
+        result = rolling_mean(column, window, min_periods)
+        for k in range(rows.shape[0]):
+            out[rows[k], j] = result[k]
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def qpi_features_2d(close, present, lookback_ma, lookback_vol, historical_vol_period):
+    """
+    Column-wise `qpi_features` over a (date x ticker) close matrix.
+
+    Windows and returns run over each ticker's own rows (see `_present_rows`).
+
+    Returns:
+        Tuple of float64 matrices (ma, recent_vol, historical_vol), NaN
+        where not present
+    """
+    n_dates, n_tickers = close.shape
+    ma = np.full((n_tickers, n_dates), np.nan).T
+    recent_vol = np.full((n_tickers, n_dates), np.nan).T
+    historical_vol = np.full((n_tickers, n_dates), np.nan).T
+
+    for j in range(n_tickers):
+        rows, column = _present_rows(close, present, j)
+        col_ma, col_recent, col_hist = qpi_features(
+            column, lookback_ma, lookback_vol, historical_vol_period
+        )
+        for k in range(rows.shape[0]):
+            ma[rows[k], j] = col_ma[k]
+            recent_vol[rows[k], j] = col_recent[k]
+            historical_vol[rows[k], j] = col_hist[k]
+
+    return ma, recent_vol, historical_vol
+
+
+@njit(cache=True, nogil=True)
+def rank_pct_rows(values):
+    """
+    Percentile rank of each value within its row.
+
+    Matches pandas `rank(pct=True)` per date (method='average'): tied values
+    share the mean of their ranks, ranks are divided by the number of valid
+    values in the row, and NaNs stay NaN and are not counted.
+
+    Args:
+        values: 2-D float array, one row per date
+
+    Returns:
+        float64 matrix of the same shape with ranks in (0, 1]
+    """
+    n_rows, n_cols = values.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    valid = np.empty(n_cols, dtype=np.int64)
+
+    for i in range(n_rows):
+        n_valid = 0
+        for j in range(n_cols):
+            if not np.isnan(values[i, j]):
+                valid[n_valid] = j
+                n_valid += 1
+        if n_valid == 0:
+            continue
+
+        row = np.empty(n_valid, dtype=np.float64)
+        for k in range(n_valid):
+            row[k] = values[i, valid[k]]
+        order = np.argsort(row)
+
+        # Walk runs of tied values; each gets the average of its 1-based ranks
+        start = 0
+        while start < n_valid:
+            end = start
+            while end + 1 < n_valid and row[order[end + 1]] == row[order[start]]:
+                end += 1
+            pct = ((start + end) / 2.0 + 1.0) / n_valid
+            for k in range(start, end + 1):
+                out[i, valid[order[k]]] = pct
+            start = end + 1
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def drawdown(equity):
+    """
+    Single-pass drawdown of an equity curve.
+
+    Works on the equity values directly, `equity / running_max - 1`, rather
+    than re-compounding `(1 + equity.pct_change()).cumprod()` (the same
+    curve up to rounding drift). As with the returns-based form, the peak
+    is tracked from the first return onward, so the first observation is
+    NaN and the starting value itself is not a peak.
+
+    Args:
+        equity: 1-D array of portfolio values (chronological)
+
+    Returns:
+        float64 array of drawdowns (<= 0), NaN for the first observation
+    """
+    n = equity.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    running_max = np.nan
+
+    for i in range(n):
+        value = equity[i]
+        if i == 0 or np.isnan(value):
+            out[i] = np.nan
+            continue
+
+        if np.isnan(running_max) or value > running_max:
+            running_max = value
+        out[i] = value / running_max - 1.0
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def equity_stats(equity):
+    """
+    Daily-return volatility and maximum drawdown in one pass.
+
+    Replaces a pandas `pct_change().std()` plus a separate drawdown pass
+    with one loop: Welford's running variance of the returns alongside the
+    same running-max recurrence on the equity values as `drawdown`.
+
+    Args:
+        equity: 1-D array of portfolio values (chronological)
+
+    Returns:
+        Tuple of (sample std of daily returns, maximum drawdown <= 0);
+        NaN when there are too few valid returns
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    running_max = np.nan
+    max_drawdown = np.nan
+
+    for i in range(1, equity.shape[0]):
+        value = equity[i]
+        if np.isnan(value):
+            continue
+
+        r = value / equity[i - 1] - 1.0
+        if not np.isnan(r):
+            count += 1
+            delta = r - mean
+            mean += delta / count
+            m2 += delta * (r - mean)
+
+        if np.isnan(running_max) or value > running_max:
+            running_max = value
+        dd = value / running_max - 1.0
+        if np.isnan(max_drawdown) or dd < max_drawdown:
+            max_drawdown = dd
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    return std, max_drawdown
+
+
+@njit(cache=True, nogil=True)
+def _grow_rows(buffer):
+    """Return a copy of a 2-D record buffer with twice the rows."""
+    out = np.empty((2 * buffer.shape[0], buffer.shape[1]), dtype=buffer.dtype)
+    out[:buffer.shape[0]] = buffer
+    return out
+
+
+@njit(cache=True, nogil=True)
+def simulate_rebalance(prices, weights, present, trading_days,
+                       initial_capital, commission, slippage):
+    """
+    Daily target-weight rebalance loop of `BacktestEngine.run`.
+
+    Each trading day: value held positions at today's prices, sell held
+    tickers that are no longer targeted (unpriced ones are dropped), then
+    move every targeted ticker to `portfolio_value * weight / (price *
+    (1 + slippage))` shares when the change exceeds 0.01 shares, paying
+    slippage and commission. Positions live in per-ticker arrays; trades
+    and holdings are appended to growable record buffers.
+
+    Args:
+        prices: (date x ticker) close matrix
+        weights: (date x ticker) target weights (0 = not targeted)
+        present: (date x ticker) mask of priced (date, ticker) cells
+        trading_days: Row positions of the days to simulate (ascending)
+        initial_capital: Starting cash
+        commission: Commission rate per trade
+        slippage: Slippage rate per trade
+
+    Returns:
+        Tuple of float64 matrices:
+            equity   (n_days x 3): portfolio value, cash, positions value
+            trades   (n_trades x 5): day, ticker column, signed shares
+                     (negative = sell), price, pnl (exits only)
+            holdings (n_holdings x 4): day, ticker column, shares, entry
+                     price of each position held at the end of the day
+        where day is the position in `trading_days`
+    """
+    n_days = trading_days.shape[0]
+    n_tickers = prices.shape[1]
+
+    equity = np.empty((n_days, 3), dtype=np.float64)
+    trades = np.empty((max(n_days, 16), 5), dtype=np.float64)
+    holdings = np.empty((max(n_days, 16), 4), dtype=np.float64)
+    n_trades = 0
+    n_holdings = 0
+
+    held = np.zeros(n_tickers, dtype=np.bool_)
+    shares = np.zeros(n_tickers, dtype=np.float64)
+    entry_prices = np.zeros(n_tickers, dtype=np.float64)
+    cash = initial_capital
+
+    for t in range(n_days):
+        day = trading_days[t]
+
+        # Current portfolio value
+        positions_value = 0.0
+        for j in range(n_tickers):
+            if held[j] and present[day, j]:
+                positions_value += shares[j] * prices[day, j]
+        portfolio_value = cash + positions_value
+
+        # Close positions not in target
+        for j in range(n_tickers):
+            if held[j] and not (present[day, j] and weights[day, j] > 0):
+                if present[day, j]:
+                    exit_price = prices[day, j] * (1 - slippage)
+                    cash += shares[j] * exit_price * (1 - commission)
+
+                    if n_trades == trades.shape[0]:
+                        trades = _grow_rows(trades)
+                    trades[n_trades, 0] = t
+                    trades[n_trades, 1] = j
+                    trades[n_trades, 2] = -shares[j]
+                    trades[n_trades, 3] = exit_price
+                    trades[n_trades, 4] = shares[j] * (exit_price - entry_prices[j])
+                    n_trades += 1
+                held[j] = False
+                shares[j] = 0.0
+
+        # Open/adjust positions in target (minimum trade threshold)
+        for j in range(n_tickers):
+            if not (present[day, j] and weights[day, j] > 0):
+                continue
+            price = prices[day, j]
+            target_shares = portfolio_value * weights[day, j] / (price * (1 + slippage))
+            shares_diff = target_shares - shares[j]
+            if abs(shares_diff) <= 0.01:
+                continue
+
+            trade_value = shares_diff * price * (1 + slippage)
+            cash -= trade_value + abs(trade_value) * commission
+            held[j] = True
+            shares[j] = target_shares
+            entry_prices[j] = price
+
+            if n_trades == trades.shape[0]:
+                trades = _grow_rows(trades)
+            trades[n_trades, 0] = t
+            trades[n_trades, 1] = j
+            trades[n_trades, 2] = shares_diff
+            trades[n_trades, 3] = price
+            trades[n_trades, 4] = 0.0
+            n_trades += 1
+
+        # End-of-day snapshot
+        for j in range(n_tickers):
+            if held[j]:
+                if n_holdings == holdings.shape[0]:
+                    holdings = _grow_rows(holdings)
+                holdings[n_holdings, 0] = t
+                holdings[n_holdings, 1] = j
+                holdings[n_holdings, 2] = shares[j]
+                holdings[n_holdings, 3] = entry_prices[j]
+                n_holdings += 1
+
+        equity[t, 0] = portfolio_value
+        equity[t, 1] = cash
+        equity[t, 2] = positions_value
+
+    return equity, trades[:n_trades].copy(), holdings[:n_holdings].copy()
+
+
+if not NUMBA_AVAILABLE:
+    def drawdown(equity):
+        """
+        Vectorized drawdown used when numba is not installed.
+
+        Same result as the compiled loop, but built from a whole-array
+        running maximum (fmax.accumulate) instead of a per-element loop.
+        """
+        equity = np.asarray(equity, dtype=np.float64)
+        out = np.full(equity.shape[0], np.nan)
+        if equity.shape[0] < 2:
+            return out
+
+        running_max = np.fmax.accumulate(equity[1:])
+        out[1:] = equity[1:] / running_max - 1.0
+        return out
+
+
+    def equity_stats(equity):
+        """Vectorized `equity_stats` used when numba is not installed."""
+        equity = np.asarray(equity, dtype=np.float64)
+        if equity.shape[0] < 2:
+            return np.nan, np.nan
+
+        returns = equity[1:] / equity[:-1] - 1.0
+        valid = ~np.isnan(returns)
+        std = np.std(returns[valid], ddof=1) if valid.sum() > 1 else np.nan
+        max_drawdown = np.nanmin(drawdown(equity)) if not np.isnan(equity[1:]).all() else np.nan
+        return std, max_drawdown
+
+
+    def rank_pct_rows(values):
+        """Row-wise percentile rank used when numba is not installed (pandas)."""
+        import pandas as pd
+        return pd.DataFrame(values).rank(axis=1, pct=True).to_numpy(dtype=np.float64)
+
+    def simulate_rebalance(prices, weights, present, trading_days,
+                           initial_capital, commission, slippage):
+        """
+        `simulate_rebalance` used when numba is not installed.
+
+        The day loop is inherently sequential (targets depend on the cash
+        left by earlier trades), so only the per-ticker work of each day is
+        vectorized with whole-row array operations.
+        """
+        n_days = len(trading_days)
+        n_tickers = prices.shape[1]
+
+        equity = np.empty((n_days, 3), dtype=np.float64)
+        trades = []
+        holdings = []
+
+        held = np.zeros(n_tickers, dtype=bool)
+        shares = np.zeros(n_tickers, dtype=np.float64)
+        entry_prices = np.zeros(n_tickers, dtype=np.float64)
+        cash = initial_capital
+
+        for t, day in enumerate(trading_days):
+            prices_today = prices[day].astype(np.float64)
+            weights_today = weights[day]
+            present_today = present[day]
+
+            # Current portfolio value
+            priced = np.flatnonzero(held & present_today)
+            positions_value = float(shares[priced] @ prices_today[priced])
+            portfolio_value = cash + positions_value
+
+            target = present_today & (weights_today > 0)
+            target_cols = np.flatnonzero(target)
+            target_prices = prices_today[target_cols]
+            target_shares = (portfolio_value * weights_today[target_cols]
+                             / (target_prices * (1 + slippage)))
+
+            # Close positions not in target
+            closing = held & ~target
+            sell_cols = np.flatnonzero(closing & present_today)
+            exit_prices = prices_today[sell_cols] * (1 - slippage)
+            sold_shares = shares[sell_cols]
+            cash += float(np.sum(sold_shares * exit_prices * (1 - commission)))
+            trades.append(np.column_stack((
+                np.full(len(sell_cols), t), sell_cols, -sold_shares, exit_prices,
+                sold_shares * (exit_prices - entry_prices[sell_cols])
+            )))
+            held[closing] = False
+            shares[closing] = 0.0
+
+            # Open/adjust positions in target (minimum trade threshold)
+            shares_diff = target_shares - shares[target_cols]
+            trading = np.abs(shares_diff) > 0.01
+            trade_cols = target_cols[trading]
+            trade_prices = target_prices[trading]
+            shares_diff = shares_diff[trading]
+
+            trade_value = shares_diff * trade_prices * (1 + slippage)
+            cash -= float(np.sum(trade_value + np.abs(trade_value) * commission))
+            held[trade_cols] = True
+            shares[trade_cols] = target_shares[trading]
+            entry_prices[trade_cols] = trade_prices
+            trades.append(np.column_stack((
+                np.full(len(trade_cols), t), trade_cols, shares_diff, trade_prices,
+                np.zeros(len(trade_cols))
+            )))
+
+            # End-of-day snapshot
+            held_cols = np.flatnonzero(held)
+            holdings.append(np.column_stack((
+                np.full(len(held_cols), t), held_cols, shares[held_cols], entry_prices[held_cols]
+            )))
+
+            equity[t] = portfolio_value, cash, positions_value
+
+        trades = np.concatenate(trades) if trades else np.empty((0, 5))
+        holdings = np.concatenate(holdings) if holdings else np.empty((0, 4))
+        return equity, trades.astype(np.float64), holdings.astype(np.float64)
+
+
+# Ahead-of-time build (python build_native.py) takes precedence when present
+try:
+    from _native import drawdown as _native_drawdown
+except ImportError:
+    _native_drawdown = None
+
+if _native_drawdown is not None:
+    def drawdown(equity):
+        """AOT-compiled `drawdown` (see build_native.py); float64 input."""
+        return _native_drawdown(np.asarray(equity, dtype=np.float64))
@@ -6,6 +6,7 @@ Combines multiple strategies using "Learning to Rank" philosophy.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from strategy_base import Strategy
@@ -43,12 +44,17 @@ class PortfolioManager:
         self.combined_signals = None
         self.correlation_matrix = None
     
-    def generate_ensemble_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def generate_ensemble_signals(self,
+                                  data: pd.DataFrame,
+                                  precomputed_signals: Optional[Dict[str, pd.DataFrame]] = None
+                                  ) -> pd.DataFrame:
         """
         Generate ensemble signals by combining all strategies.
         
         Args:
             data: Market data with MultiIndex (date, ticker)
+            precomputed_signals: Optional strategy name -> signals mapping;
+                                 strategies found here are not re-run
         
         Returns:
             DataFrame with combined signals and rankings
@@ -58,11 +64,26 @@ class PortfolioManager:
         print(f"{'='*60}")
         
         all_signals = []
+        precomputed_signals = precomputed_signals or {}
+        
+        # Step 1: Generate signals from each strategy. Strategies are
+        # independent, so the ones not precomputed run concurrently (threads
+        # share `data` without copying; the NumPy/numba kernels release the GIL)
+        to_run = [s for s in self.strategies if s.name not in precomputed_signals]
+        if to_run:
+            with ThreadPoolExecutor(max_workers=len(to_run)) as executor:
+                generated = dict(zip(
+                    [s.name for s in to_run],
+                    executor.map(lambda s: s.generate_signals(data), to_run)
+                ))
         
-        # Step 1: Generate signals from each strategy
         for strategy in self.strategies:
-            print(f"\n→ Running: {strategy}")
-            signals = strategy.generate_signals(data)
+            if strategy.name in precomputed_signals:
+                print(f"\n→ Using precomputed signals: {strategy}")
+                signals = precomputed_signals[strategy.name]
+            else:
+                print(f"\n→ Running: {strategy}")
+                signals = generated[strategy.name]
             signals = signals.rename(columns={'signal': f'signal_{strategy.name}'})
             all_signals.append(signals[[f'signal_{strategy.name}']])
             self.strategy_signals[strategy.name] = signals
@@ -117,7 +138,16 @@ class PortfolioManager:
                       if col.startswith('signal_') and not col.endswith('_normalized')]
         
         if len(signal_cols) > 0:
-            self.correlation_matrix = self.combined_signals[signal_cols].corr()
+            signal_matrix = self.combined_signals[signal_cols].to_numpy(dtype=np.float64)
+            
+            if np.isnan(signal_matrix).any():
+                # Pairwise-complete correlation for misaligned strategy outputs
+                self.correlation_matrix = self.combined_signals[signal_cols].corr()
+            else:
+                # One BLAS-backed pass over the stacked (rows x strategies) matrix
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    corr = np.atleast_2d(np.corrcoef(signal_matrix, rowvar=False))
+                self.correlation_matrix = pd.DataFrame(corr, index=signal_cols, columns=signal_cols)
             
             print(f"\n{'─'*60}")
             print("STRATEGY CORRELATION MATRIX")
@@ -4,15 +4,38 @@ Run Simulation Page - Ensemble Trading Dashboard
 Page for configuring and running ensemble backtests.
 """
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 
+from strategy_base import index_level, level_max
+from export_utils import csv_bytes
+from numba_kernels import drawdown as equity_drawdown
 from portfolio_manager import PortfolioManager, PortfolioConfig
-from backtest_engine import BacktestEngine
+from mean_reversion_strategy import MeanReversionQP
+from trend_strategy import SimpleTrend
+from momentum_strategy import MomentumStrategy
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_plotly():
+    """
+    Import Plotly on first use.
+    
+    Charts are only built after "Run Backtest", so configuring the sidebar
+    never pays for the import.
+    
+    Returns:
+        Tuple of (plotly.graph_objects, plotly.express, plotly.io)
+    """
+    import plotly.graph_objects as go
+    import plotly.express as px
+    import plotly.io as pio
+    return go, px, pio
 
 
 class RandomStrategy:
@@ -23,16 +46,293 @@ class RandomStrategy:
         self.seed = seed
     
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        np.random.seed(self.seed)
-        df = data.copy()
-        df['signal'] = np.random.uniform(-1, 1, len(df))
-        df['confidence'] = np.random.uniform(0.3, 0.7, len(df))
-        return df[['signal', 'confidence']]
+        # Local generator: reproducible per call without touching global np.random state
+        rng = np.random.default_rng(self.seed)
+        
+        # Fill both columns in place (Fortran order keeps each column contiguous)
+        out = np.empty((len(data), 2), order='F')
+        signal, confidence = out[:, 0], out[:, 1]
+        rng.random(out=signal)
+        rng.random(out=confidence)
+        signal *= 2.0
+        signal -= 1.0      # uniform(-1, 1)
+        confidence *= 0.4
+        confidence += 0.3  # uniform(0.3, 0.7)
+        
+        return pd.DataFrame(out, index=data.index, columns=['signal', 'confidence'])
     
     def __repr__(self) -> str:
         return f"RandomStrategy(name='{self.name}')"
 
 
+def build_strategy(strategy_type: str, params: tuple):
+    """
+    Instantiate a strategy from its type key.
+    
+    Args:
+        strategy_type: One of 'mean_reversion', 'trend', 'momentum', 'random'
+        params: Hashable tuple of (keyword, value) constructor arguments
+    
+    Returns:
+        Strategy instance
+    """
+    kwargs = dict(params)
+    
+    if strategy_type == "mean_reversion":
+        return MeanReversionQP(name="MeanReversion", **kwargs)
+    elif strategy_type == "trend":
+        return SimpleTrend(name="TrendFollowing", **kwargs)
+    elif strategy_type == "momentum":
+        return MomentumStrategy(name="Momentum", **kwargs)
+    elif strategy_type == "random":
+        return RandomStrategy(name="Random", **kwargs)
+    
+    raise ValueError(f"Unknown strategy type: {strategy_type}")
+
+
+# Charts with more points than this are down-sampled before plotting
+PLOT_MAX_POINTS = 5000
+PLOT_TARGET_POINTS = 2000
+
+# Backtest runs kept in memory; each holds full-length signal frames, so
+# sweeping the sliders must not grow the cache without bound
+RESULTS_CACHE_ENTRIES = 8
+
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int = PLOT_TARGET_POINTS) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets down-sampling for line charts.
+    
+    Keeps the first and last points and, from each of `n_out - 2` equal
+    buckets in between, the point forming the largest triangle with the
+    previously kept point and the mean of the next bucket, which preserves
+    the visual shape of the curve.
+    
+    Args:
+        x: Numeric x values (e.g. int64 nanosecond timestamps), ascending
+        y: Values to plot (NaN treated as 0 when choosing points)
+        n_out: Number of points to keep
+    
+    Returns:
+        Sorted positions of the kept points
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.nan_to_num(np.asarray(y, dtype=np.float64))
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    
+    return keep
+
+
+@st.cache_data(show_spinner=False)
+def correlation_figure_json(values: tuple, labels: tuple) -> str:
+    """
+    Build the strategy correlation heatmap once per matrix, as Plotly JSON.
+    
+    Reruns that leave the matrix unchanged (tweaking unrelated widgets)
+    reuse the serialized figure instead of rebuilding the px.imshow spec
+    and its per-cell text annotations.
+    
+    Args:
+        values: Flattened correlation matrix (row-major, rounded)
+        labels: Strategy names, in matrix order
+    
+    Returns:
+        Figure JSON for plotly.io.from_json
+    """
+    _, px, _ = _lazy_plotly()
+    
+    corr_matrix = pd.DataFrame(
+        np.reshape(values, (len(labels), len(labels))),
+        index=labels,
+        columns=labels
+    )
+    
+    fig_corr = px.imshow(
+        corr_matrix,
+        text_auto='.3f',
+        color_continuous_scale='RdBu_r',
+        color_continuous_midpoint=0,
+        aspect='auto'
+    )
+    
+    fig_corr.update_layout(
+        title="Strategy Signal Correlation",
+        height=400,
+        template='plotly_white'
+    )
+    
+    return fig_corr.to_json()
+
+
+@st.cache_data(show_spinner=False)
+def compute_signals(strategy_type: str, params: tuple, data_id: tuple,
+                    _market_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Generate (and memoize) the signals of one strategy.
+    
+    The cache is keyed on the strategy type, its parameters and data_id only;
+    the leading underscore keeps Streamlit from hashing the market data itself.
+    
+    Args:
+        strategy_type: Strategy type key (see build_strategy)
+        params: Hashable tuple of (keyword, value) constructor arguments
+        data_id: Hashable identity of _market_data (source, mtime, filters)
+        _market_data: Market data with MultiIndex (date, ticker)
+    
+    Returns:
+        DataFrame with 'signal' and 'confidence' columns
+    """
+    return build_strategy(strategy_type, params).generate_signals(_market_data)
+
+
+@st.cache_data(show_spinner=False)
+def describe_market_data(data_id: tuple, _market_data: pd.DataFrame) -> tuple:
+    """
+    Summarize market data from its MultiIndex levels.
+    
+    Levels are already unique and sorted, so no full-length label arrays are
+    materialized; unused levels (left behind by filtering) are dropped first.
+    
+    Args:
+        data_id: Hashable identity of _market_data (see compute_signals)
+        _market_data: Market data with MultiIndex (date, ticker)
+    
+    Returns:
+        Tuple of (num_tickers, start_date, end_date, num_records)
+    """
+    index = _market_data.index.remove_unused_levels()
+    dates = index.levels[index.names.index('date')]
+    tickers = index.levels[index.names.index('ticker')]
+    return len(tickers), dates.min(), dates.max(), len(_market_data)
+
+
+@st.cache_data(show_spinner=False, max_entries=2 * RESULTS_CACHE_ENTRIES)
+def results_csv(run_key: tuple, name: str, _df: pd.DataFrame) -> bytes:
+    """
+    CSV bytes of one result frame of a backtest run (memoized).
+    
+    Download buttons need the file contents up front; caching them per run
+    keeps reruns of the results page from serializing the frames again.
+    Bounded like `run_ensemble_backtest` (two frames per cached run).
+    
+    Args:
+        run_key: Arguments of the run_ensemble_backtest call that produced _df
+        name: Result frame name ('equity_curve', 'ensemble_signals')
+        _df: Result frame (not hashed)
+    
+    Returns:
+        CSV file contents
+    """
+    return csv_bytes(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULTS_CACHE_ENTRIES)
+def run_ensemble_backtest(strategy_specs: tuple, top_n_assets: int,
+                          initial_capital: float, commission: float, slippage: float,
+                          data_id: tuple, _market_data: pd.DataFrame) -> dict:
+    """
+    Combine strategy signals and backtest the ensemble (memoized).
+    
+    Re-clicking "Run Backtest" with an unchanged configuration returns the
+    cached results instead of re-running the ensemble and the day loop.
+    
+    Args:
+        strategy_specs: Tuple of (strategy_type, params) pairs (see build_strategy)
+        top_n_assets: Number of assets held per rebalance
+        initial_capital: Starting portfolio value
+        commission: Trading commission (as decimal)
+        slippage: Price slippage (as decimal)
+        data_id: Hashable identity of _market_data (see compute_signals)
+        _market_data: Market data with MultiIndex (date, ticker)
+    
+    Returns:
+        Dict with 'ensemble_signals', 'correlation_matrix', 'equity_curve',
+        'metrics', 'last_date' and 'top_assets'
+    """
+    # Heavy module (matplotlib via BacktestEngine) loads on first run only
+    from backtest_engine import BacktestEngine
+    
+    strategy_objects = [
+        build_strategy(strategy_type, params)
+        for strategy_type, params in strategy_specs
+    ]
+    
+    # Strategies are independent: generate their signals concurrently
+    # (threads share market_data without pickling; the NumPy/numba
+    # kernels release the GIL)
+    script_ctx = get_script_run_ctx()
+    
+    def run_strategy(spec):
+        add_script_run_ctx(ctx=script_ctx)
+        return compute_signals(spec[0], spec[1], data_id, _market_data)
+    
+    with ThreadPoolExecutor(max_workers=max(len(strategy_specs), 1)) as executor:
+        signals = list(executor.map(run_strategy, strategy_specs))
+    
+    precomputed_signals = {
+        strategy.name: strategy_signals
+        for strategy, strategy_signals in zip(strategy_objects, signals)
+    }
+    
+    # Create Portfolio Manager
+    config = PortfolioConfig(
+        top_n_assets=top_n_assets,
+        rebalance_frequency='daily',
+        equal_weight=True,
+        long_only=True
+    )
+    
+    portfolio_manager = PortfolioManager(
+        strategies=strategy_objects,
+        config=config
+    )
+    
+    # Generate ensemble signals
+    ensemble_signals = portfolio_manager.generate_ensemble_signals(
+        _market_data,
+        precomputed_signals=precomputed_signals
+    )
+    
+    # Run backtest
+    backtest_engine = BacktestEngine(
+        initial_capital=initial_capital,
+        commission=commission,
+        slippage=slippage
+    )
+    
+    equity_curve = backtest_engine.run(_market_data, ensemble_signals)
+    
+    last_date = level_max(ensemble_signals.index, 'date')
+    
+    return {
+        'ensemble_signals': ensemble_signals,
+        'correlation_matrix': portfolio_manager.correlation_matrix,
+        'equity_curve': equity_curve,
+        'metrics': backtest_engine.get_performance_metrics(),
+        'last_date': last_date,
+        'top_assets': portfolio_manager.get_top_assets(last_date, top_n=top_n_assets)
+    }
+
+
 def render_simulation_page(MODEL_INFO, load_nasdaq_data):
     """Render the simulation configuration and execution page."""
     
@@ -63,10 +363,15 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
     if st.session_state.get('date_filter_enabled', False):
         filter_start = st.session_state.get('date_filter_start')
         filter_end = st.session_state.get('date_filter_end')
-        market_data = market_data.loc[
-            (market_data.index.get_level_values('date') >= filter_start) &
-            (market_data.index.get_level_values('date') <= filter_end)
-        ]
+        if market_data.index.is_monotonic_increasing:
+            # Sorted index: binary search for the row bounds, then one
+            # positional slice (no per-row mask)
+            start_row, end_row = market_data.index.slice_locs(filter_start, filter_end)
+            market_data = market_data.iloc[start_row:end_row]
+        else:
+            date_codes, dates = index_level(market_data.index, 'date')
+            in_range = (dates >= filter_start) & (dates <= filter_end)
+            market_data = market_data.loc[in_range[date_codes]]
         st.sidebar.info(f"📅 Date filter active: {filter_start.date()} to {filter_end.date()}")
     
     # Apply ticker filter if enabled
@@ -74,26 +379,38 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         filter_type = st.session_state.get('ticker_filter_type')
         ticker_list = st.session_state.get('ticker_filter')
         
+        ticker_codes, tickers = index_level(market_data.index, 'ticker')
+        in_list = tickers.isin(ticker_list)[ticker_codes]
+        
         if filter_type == "include":
-            market_data = market_data.loc[
-                market_data.index.get_level_values('ticker').isin(ticker_list)
-            ]
+            market_data = market_data.loc[in_list]
             st.sidebar.info(f"🎯 Using {len(ticker_list)} selected tickers")
         elif filter_type == "exclude":
-            market_data = market_data.loc[
-                ~market_data.index.get_level_values('ticker').isin(ticker_list)
-            ]
+            market_data = market_data.loc[~in_list]
             st.sidebar.info(f"🎯 Excluding {len(ticker_list)} tickers")
     
+    if len(market_data) == 0:
+        st.warning("⚠️ No market data left after applying the filters. Adjust them on the 💾 Data page.")
+        st.stop()
+    
+    # Identity of the (filtered) market data, used as the signal cache key;
+    # the loader's content digest also covers S3 data, which has no local mtime
+    data_id = (
+        data_source,
+        market_data.attrs.get('_digest'),
+        len(market_data),
+        (st.session_state.get('date_filter_start'), st.session_state.get('date_filter_end'))
+        if st.session_state.get('date_filter_enabled', False) else None,
+        st.session_state.get('ticker_filter_type'),
+        tuple(st.session_state.get('ticker_filter') or ())
+    )
+    
     # Display data info
-    num_tickers = len(market_data.index.get_level_values('ticker').unique())
-    date_range = market_data.index.get_level_values('date').unique()
-    start_date = date_range.min()
-    end_date = date_range.max()
+    num_tickers, start_date, end_date, num_records = describe_market_data(data_id, market_data)
     
     st.sidebar.success("✅ Data Loaded")
     st.sidebar.metric("Tickers", num_tickers)
-    st.sidebar.metric("Records", f"{len(market_data):,}")
+    st.sidebar.metric("Records", f"{num_records:,}")
     
     st.sidebar.markdown("---")
     
@@ -129,13 +446,19 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
     
     st.sidebar.subheader("📐 Portfolio Settings")
     
-    top_n_assets = st.sidebar.slider(
-        "Max Positions",
-        min_value=3,
-        max_value=min(20, num_tickers),
-        value=5,
-        help="Maximum number of assets to hold simultaneously"
-    )
+    # The slider needs more tickers than its minimum; smaller universes
+    # simply hold every ticker
+    if num_tickers > 3:
+        top_n_assets = st.sidebar.slider(
+            "Max Positions",
+            min_value=3,
+            max_value=min(20, num_tickers),
+            value=min(5, num_tickers),
+            help="Maximum number of assets to hold simultaneously"
+        )
+    else:
+        top_n_assets = num_tickers
+        st.sidebar.caption(f"Max Positions: {top_n_assets} (all filtered tickers)")
     
     st.sidebar.markdown("---")
     
@@ -204,65 +527,45 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
     
     if run_backtest:
         
+        # Plotly loads on first run only
+        go, _, pio = _lazy_plotly()
+        
         with st.spinner("Running ensemble backtest..."):
             
-            # Initialize strategies
-            strategy_objects = []
+            # Initialize strategies (signals are memoized per parameter set)
+            strategy_specs = []
             
             for strategy_name in selected_strategies:
                 strategy_type = available_strategies[strategy_name]
                 
                 if strategy_type == "mean_reversion":
-                    strategy_class = MODEL_INFO["Mean Reversion"]["class"]
-                    strategy_objects.append(strategy_class(
-                        name="MeanReversion",
-                        lookback_ma=mr_lookback_ma,
-                        lookback_vol=mr_lookback_vol,
-                        historical_vol_period=mr_hist_vol
-                    ))
-                
+                    params = (
+                        ("lookback_ma", mr_lookback_ma),
+                        ("lookback_vol", mr_lookback_vol),
+                        ("historical_vol_period", mr_hist_vol)
+                    )
                 elif strategy_type == "trend":
-                    strategy_class = MODEL_INFO["Trend Following"]["class"]
-                    strategy_objects.append(strategy_class(
-                        name="TrendFollowing",
-                        sma_period=trend_sma_period
-                    ))
-                
+                    params = (("sma_period", trend_sma_period),)
                 elif strategy_type == "momentum":
-                    strategy_class = MODEL_INFO["Momentum"]["class"]
-                    strategy_objects.append(strategy_class(
-                        name="Momentum",
-                        lookback_period=momentum_lookback
-                    ))
+                    params = (("lookback", momentum_lookback),)
+                else:
+                    params = ()
                 
-                elif strategy_type == "random":
-                    strategy_objects.append(RandomStrategy(name="Random"))
+                strategy_specs.append((strategy_type, params))
             
-            # Create Portfolio Manager
-            config = PortfolioConfig(
-                top_n_assets=top_n_assets,
-                rebalance_frequency='daily',
-                equal_weight=True,
-                long_only=True
+            run_key = (
+                tuple(strategy_specs),
+                top_n_assets,
+                initial_capital,
+                commission,
+                slippage,
+                data_id
             )
+            results = run_ensemble_backtest(*run_key, market_data)
             
-            portfolio_manager = PortfolioManager(
-                strategies=strategy_objects,
-                config=config
-            )
-            
-            # Generate ensemble signals
-            ensemble_signals = portfolio_manager.generate_ensemble_signals(market_data)
-            
-            # Run backtest
-            backtest_engine = BacktestEngine(
-                initial_capital=initial_capital,
-                commission=commission,
-                slippage=slippage
-            )
-            
-            equity_curve = backtest_engine.run(market_data, ensemble_signals)
-            metrics = backtest_engine.get_performance_metrics()
+            ensemble_signals = results['ensemble_signals']
+            equity_curve = results['equity_curve']
+            metrics = results['metrics']
         
         # --------------------------------------------------------
         # DISPLAY RESULTS
@@ -303,11 +606,19 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         # Equity Curve
         st.header("💰 Equity Curve")
         
+        # WebGL traces keep multi-year daily curves responsive in the browser;
+        # very long curves are LTTB down-sampled before being sent at all
+        plot_dates = equity_curve.index
+        portfolio_value = equity_curve['portfolio_value'].to_numpy()
+        downsample = len(portfolio_value) > PLOT_MAX_POINTS
+        
+        keep = _lttb(plot_dates.asi8, portfolio_value) if downsample else slice(None)
+        
         fig_equity = go.Figure()
         
-        fig_equity.add_trace(go.Scatter(
-            x=equity_curve.index,
-            y=equity_curve['portfolio_value'],
+        fig_equity.add_trace(go.Scattergl(
+            x=plot_dates[keep],
+            y=portfolio_value[keep],
             mode='lines',
             name='Portfolio Value',
             line=dict(color='#2E86AB', width=2),
@@ -335,15 +646,15 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         
         # Drawdown
         with st.expander("📉 Drawdown Analysis", expanded=False):
-            returns = equity_curve['portfolio_value'].pct_change()
-            cumulative = (1 + returns).cumprod()
-            running_max = cumulative.expanding().max()
-            drawdown = (cumulative - running_max) / running_max
+            # Compiled single pass over the equity curve (value / running
+            # max - 1); the raw array goes straight to Plotly, no intermediate Series
+            drawdown = equity_drawdown(portfolio_value) * 100
+            keep = _lttb(plot_dates.asi8, drawdown) if downsample else slice(None)
             
             fig_dd = go.Figure()
-            fig_dd.add_trace(go.Scatter(
-                x=drawdown.index,
-                y=drawdown * 100,
+            fig_dd.add_trace(go.Scattergl(
+                x=plot_dates[keep],
+                y=drawdown[keep],
                 mode='lines',
                 fill='tozeroy',
                 line=dict(color='#A23B72', width=2)
@@ -362,45 +673,42 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         
         st.markdown("---")
         
-        # Strategy Correlation
-        st.header("🔗 Strategy Correlation Matrix")
-        
-        if portfolio_manager.correlation_matrix is not None:
-            corr_matrix = portfolio_manager.correlation_matrix.copy()
-            corr_matrix.columns = [col.replace('signal_', '') for col in corr_matrix.columns]
-            corr_matrix.index = [idx.replace('signal_', '') for idx in corr_matrix.index]
-            
-            fig_corr = px.imshow(
-                corr_matrix,
-                text_auto='.3f',
-                color_continuous_scale='RdBu_r',
-                color_continuous_midpoint=0,
-                aspect='auto'
-            )
-            
-            fig_corr.update_layout(
-                title="Strategy Signal Correlation",
-                height=400,
-                template='plotly_white'
-            )
+        # Strategy Correlation (a single strategy has nothing to correlate;
+        # collapsed by default so the heatmap is not sent until opened)
+        if len(selected_strategies) >= 2 and results['correlation_matrix'] is not None:
+            with st.expander("🔗 Strategy Correlation Matrix", expanded=False):
+                # Key the cached figure on the (rounded) matrix and the
+                # strategy names without their column prefix
+                corr_matrix = results['correlation_matrix']
+                fig_json = correlation_figure_json(
+                    tuple(corr_matrix.to_numpy().round(6).ravel()),
+                    tuple(col.removeprefix('signal_') for col in corr_matrix.columns)
+                )
+                
+                st.plotly_chart(pio.from_json(fig_json), use_container_width=True)
             
-            st.plotly_chart(fig_corr, use_container_width=True)
-        
-        st.markdown("---")
+            st.markdown("---")
         
         # Top Holdings
         st.header("🏆 Top Holdings (Last Rebalance)")
         
-        last_date = ensemble_signals.index.get_level_values('date').unique()[-1]
-        top_assets = portfolio_manager.get_top_assets(last_date, top_n=top_n_assets)
+        last_date = results['last_date']
+        top_assets = results['top_assets']
         
         if len(top_assets) > 0:
-            display_df = top_assets.copy()
-            display_df['combined_score'] = display_df['combined_score'].round(3)
-            display_df['weight'] = (display_df['weight'] * 100).round(2).astype(str) + '%'
-            display_df['rank'] = display_df['rank'].astype(int)
+            # Numeric columns stay numeric; Streamlit formats them client-side
+            display_df = top_assets.assign(weight=top_assets['weight'] * 100)
             
-            st.dataframe(display_df, use_container_width=True, height=300)
+            st.dataframe(
+                display_df,
+                use_container_width=True,
+                height=300,
+                column_config={
+                    'combined_score': st.column_config.NumberColumn('combined_score', format='%.3f'),
+                    'rank': st.column_config.NumberColumn('rank', format='%d'),
+                    'weight': st.column_config.NumberColumn('weight', format='%.2f%%'),
+                }
+            )
         
         st.markdown("---")
         
@@ -410,19 +718,17 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         col_dl1, col_dl2 = st.columns(2)
         
         with col_dl1:
-            equity_csv = equity_curve.to_csv()
             st.download_button(
                 label="📥 Download Equity Curve",
-                data=equity_csv,
+                data=results_csv(run_key, 'equity_curve', equity_curve),
                 file_name=f"equity_curve_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
         
         with col_dl2:
-            signals_csv = ensemble_signals.to_csv()
             st.download_button(
                 label="📥 Download Signals",
-                data=signals_csv,
+                data=results_csv(run_key, 'ensemble_signals', ensemble_signals),
                 file_name=f"signals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
@@ -438,6 +744,6 @@ def render_simulation_page(MODEL_INFO, load_nasdaq_data):
         for strategy_name in selected_strategies:
             with st.expander(f"📈 {strategy_name}", expanded=False):
                 if strategy_name in MODEL_INFO:
-                    st.markdown(MODEL_INFO[strategy_name]['short_desc'])
+                    st.markdown(MODEL_INFO[strategy_name].short_desc)
                 elif strategy_name == "Random (Benchmark)":
                     st.markdown("Generates random signals for performance baseline comparison.")
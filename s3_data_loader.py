@@ -8,12 +8,42 @@ Date: December 18, 2025
 """
 
 import pandas as pd
+import numpy as np
 import boto3
 import os
 from io import StringIO
 from typing import Optional
-import warnings
-warnings.filterwarnings('ignore')
+
+
+# Date layout of the NASDAQ CSV (see AWS_S3_SETUP.md)
+DATE_FORMAT = '%Y-%m-%d'
+
+# Suffix of the raw Parquet copy S3DataLoader keeps next to its CSV cache
+S3_RAW_PARQUET_SUFFIX = '.s3raw.parquet'
+
+
+def downcast_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast OHLC prices to float32 and volume to uint32.
+    
+    Halves the bytes every rolling window and backtest pass streams through.
+    Strategy kernels and portfolio values still accumulate in float64, so
+    returns and Sharpe ratios are unaffected beyond float32 price rounding.
+    Volume is only downcast when it is complete, non-negative and fits.
+    
+    Args:
+        df: DataFrame with 'open', 'high', 'low', 'close', 'volume' columns
+        
+    Returns:
+        Downcast DataFrame
+    """
+    df = df.astype({col: np.float32 for col in ('open', 'high', 'low', 'close')})
+    
+    volume = df['volume']
+    if volume.notna().all() and volume.min() >= 0 and volume.max() <= np.iinfo(np.uint32).max:
+        df['volume'] = volume.astype(np.uint32)
+    
+    return df
 
 
 class S3DataLoader:
@@ -75,6 +105,9 @@ class S3DataLoader:
             Exception: If file cannot be loaded from S3
         """
         cache_filename = os.path.basename(s3_key)
+        # Raw (unindexed) Parquet copy of the CSV cache; the suffix is only
+        # written by this loader, so other Parquet caches never collide
+        parquet_cache = os.path.splitext(cache_filename)[0] + S3_RAW_PARQUET_SUFFIX
         
         # Check if local cache exists and is recent
         if use_cache and os.path.exists(cache_filename):
@@ -88,7 +121,12 @@ class S3DataLoader:
                 print(f"Cache file: {cache_filename}")
                 print(f"Cache age: {cache_age_hours:.1f} hours (TTL: {cache_ttl_hours}h)")
                 
-                df = pd.read_csv(cache_filename)
+                # Prefer the typed Parquet copy unless the CSV is newer or
+                # the copy's columns no longer match the CSV header
+                df = self._read_parquet_cache(parquet_cache, cache_filename)
+                if df is None:
+                    df = pd.read_csv(cache_filename)
+                    self._write_parquet_cache(df, parquet_cache)
                 print(f"✅ Loaded {len(df):,} rows from cache")
                 return df
             else:
@@ -118,6 +156,7 @@ class S3DataLoader:
             # Save to local cache
             if use_cache:
                 df.to_csv(cache_filename, index=False)
+                self._write_parquet_cache(df, parquet_cache)
                 print(f"📦 Cached locally as: {cache_filename}")
             
             return df
@@ -126,6 +165,54 @@ class S3DataLoader:
             print(f"❌ Error loading from S3: {str(e)}")
             raise
     
+    @staticmethod
+    def _read_parquet_cache(parquet_path: str, csv_path: str) -> Optional[pd.DataFrame]:
+        """
+        Read the Parquet copy of the cached CSV if it is usable.
+        
+        The copy is used only if it is at least as new as the CSV and holds
+        exactly the CSV's columns (the raw, unindexed layout).
+        
+        Args:
+            parquet_path: Path written by `_write_parquet_cache`
+            csv_path: Cached CSV the copy was made from
+            
+        Returns:
+            Raw DataFrame, or None if the CSV must be parsed again
+        """
+        if (not os.path.exists(parquet_path)
+                or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+            return None
+        
+        try:
+            df = pd.read_parquet(parquet_path, engine='pyarrow')
+        except (OSError, ValueError):
+            return None
+        
+        if list(df.columns) != list(pd.read_csv(csv_path, nrows=0).columns):
+            return None
+        
+        return df
+    
+    @staticmethod
+    def _write_parquet_cache(df: pd.DataFrame, parquet_path: str):
+        """
+        Write a zstd-compressed Parquet copy of the cached CSV.
+        
+        Later cache hits read this instead of re-parsing the CSV text. Any
+        failure (read-only directory, columns Arrow cannot type) just skips
+        the Parquet copy; the CSV cache remains authoritative.
+        
+        Args:
+            df: Raw DataFrame as parsed from the CSV
+            parquet_path: Destination path
+        """
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        except (OSError, ValueError, TypeError):
+            if os.path.exists(parquet_path):
+                os.remove(parquet_path)
+    
     def load_nasdaq_data(
         self,
         s3_key: str,
@@ -164,8 +251,14 @@ class S3DataLoader:
         }
         df = df.rename(columns=column_mapping)
         
-        # Convert date to datetime
-        df['date'] = pd.to_datetime(df['date'])
+        # Convert date to datetime: explicit YYYY-MM-DD takes the fast
+        # C parser (cache=True parses each repeated date string once);
+        # other layouts still fall back to format inference
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            try:
+                df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT, cache=True)
+            except ValueError:
+                df['date'] = pd.to_datetime(df['date'], cache=True)
         
         # Keep only required columns
         required_cols = ['date', 'ticker', 'open', 'high', 'low', 'close', 'volume']
@@ -174,11 +267,14 @@ class S3DataLoader:
         # Remove rows with missing/NaN ticker values
         df = df.dropna(subset=['ticker'])
         
-        # Ensure ticker is string type
-        df['ticker'] = df['ticker'].astype(str)
+        # Ensure ticker is string type, stored as a categorical (int codes
+        # + one array of unique tickers instead of a Python str per row)
+        df['ticker'] = df['ticker'].astype(str).astype('category')
         
-        # Set MultiIndex
-        df = df.set_index(['date', 'ticker']).sort_index()
+        # Set MultiIndex (sorting skipped when the CSV is already in date/ticker order)
+        df = df.set_index(['date', 'ticker'])
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
         
         # Remove any duplicates
         df = df[~df.index.duplicated(keep='first')]
@@ -5,10 +5,157 @@ Following "The Bitter Lesson": Keep components simple and standardized.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import threading
+import numpy as np
 import pandas as pd
 from typing import Optional
 
 
+@dataclass(frozen=True)
+class CloseMatrix:
+    """
+    Wide (date x ticker) view of the long-format close prices.
+    
+    Attributes:
+        values: Read-only close matrix, Fortran order so each ticker's
+                series is contiguous; NaN where a (date, ticker) is missing
+        present: Read-only bool matrix, True where an input row backs the
+                 cell (a ticker's own rows, for per-ticker rolling windows)
+        dates: Row labels (chronological)
+        tickers: Column labels
+        row_date: Row position in `values` for each input row
+        row_ticker: Column position in `values` for each input row
+        unique_cells: True when no two input rows share a (date, ticker)
+                      cell, i.e. `to_long` of a matrix built from the rows
+                      loses nothing
+    """
+    values: np.ndarray
+    present: np.ndarray
+    dates: pd.Index
+    tickers: pd.Index
+    row_date: np.ndarray
+    row_ticker: np.ndarray
+    unique_cells: bool
+    
+    def to_long(self, matrix: np.ndarray) -> np.ndarray:
+        """
+        Gather a (date x ticker) result back into the input row order.
+        
+        Args:
+            matrix: Array shaped like `values`
+        
+        Returns:
+            1-D array aligned with the original long-format index
+        """
+        return matrix[self.row_date, self.row_ticker]
+
+
+_close_matrix_lock = threading.Lock()
+_close_matrix_cache: dict = {'data': None, 'matrix': None}
+
+
+def index_level(index: pd.MultiIndex, name: str) -> tuple:
+    """
+    Return the stored codes and labels of one MultiIndex level.
+    
+    Unlike `get_level_values`, this allocates nothing per row: a per-row
+    label is `labels[codes]`, and a per-row mask is a mask over the (small)
+    labels array gathered with `codes`.
+    
+    Args:
+        index: MultiIndex, e.g. (date, ticker)
+        name: Level name
+    
+    Returns:
+        Tuple of (codes ndarray, labels Index)
+    """
+    level_num = index.names.index(name)
+    return index.codes[level_num], index.levels[level_num]
+
+
+def level_max(index: pd.MultiIndex, name: str):
+    """
+    Return the largest value present in one MultiIndex level.
+    
+    A sorted index gives the first level's max from its last row; otherwise
+    the max code is looked up in the (sorted) level labels. Neither path
+    materializes per-row labels the way `get_level_values(...).unique()` does,
+    and unused labels left behind by slicing are ignored.
+    
+    Args:
+        index: MultiIndex, e.g. (date, ticker)
+        name: Level name
+    
+    Returns:
+        Largest label of that level present in the index
+    """
+    level_num = index.names.index(name)
+    if level_num == 0 and index.is_monotonic_increasing:
+        return index[-1][0]
+    
+    codes, labels = index_level(index, name)
+    if labels.is_monotonic_increasing and not (codes < 0).any():
+        return labels[codes.max()]
+    return index.get_level_values(name).max()
+
+
+def _level_positions(index: pd.MultiIndex, name: str):
+    """Return (codes, labels) for one index level, chronological/sorted."""
+    codes, labels = index_level(index, name)
+    
+    # Codes are only usable directly when the level itself is sorted
+    if labels.is_monotonic_increasing and not (codes < 0).any():
+        return np.asarray(codes, dtype=np.intp), labels
+    
+    codes, labels = pd.factorize(index.get_level_values(name), sort=True)
+    return codes, pd.Index(labels)
+
+
+def close_matrix(data: pd.DataFrame) -> CloseMatrix:
+    """
+    Pivot `data['close']` into a wide (date x ticker) matrix, once per frame.
+    
+    Every strategy in an ensemble run receives the same `data` object, so
+    the most recent pivot is memoized by identity and shared between them.
+    Duplicate (date, ticker) rows do not raise (unlike `unstack`); the last
+    occurrence wins in the matrix and every row still maps to a cell.
+    
+    Args:
+        data: DataFrame with MultiIndex (date, ticker) and a 'close' column
+    
+    Returns:
+        CloseMatrix for `data`
+    """
+    with _close_matrix_lock:
+        if _close_matrix_cache['data'] is data:
+            return _close_matrix_cache['matrix']
+    
+    row_date, dates = _level_positions(data.index, 'date')
+    row_ticker, tickers = _level_positions(data.index, 'ticker')
+    
+    close = data['close'].to_numpy()
+    if close.dtype.kind != 'f':
+        close = close.astype(np.float64)
+    
+    values = np.full((len(dates), len(tickers)), np.nan, dtype=close.dtype, order='F')
+    values[row_date, row_ticker] = close
+    values.flags.writeable = False
+    
+    cell_counts = np.bincount(row_date * len(tickers) + row_ticker, minlength=values.size)
+    unique_cells = len(cell_counts) == 0 or cell_counts.max() <= 1
+    present = (cell_counts > 0).reshape(values.shape)
+    present.flags.writeable = False
+    
+    matrix = CloseMatrix(values, present, dates, tickers, row_date, row_ticker, unique_cells)
+    
+    with _close_matrix_lock:
+        _close_matrix_cache['data'] = data
+        _close_matrix_cache['matrix'] = matrix
+    
+    return matrix
+
+
 class Strategy(ABC):
     """
     Abstract base class for all trading strategies.
@@ -10,7 +10,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 # Import our modular components
-from strategy_base import Strategy
+from strategy_base import Strategy, level_max
 from mean_reversion_strategy import MeanReversionQP
 from trend_strategy import SimpleTrend
 from portfolio_manager import PortfolioManager, PortfolioConfig
@@ -18,14 +18,14 @@ from portfolio_manager import PortfolioManager, PortfolioConfig
 
 def generate_simple_test_data():
     """Generate minimal test data."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     
     dates = pd.date_range(start='2024-01-01', periods=100, freq='D')
     tickers = ['ASSET_01', 'ASSET_02', 'ASSET_03']
     
     data = []
     for ticker in tickers:
-        prices = 100 * np.exp(np.cumsum(np.random.normal(0.001, 0.02, 100)))
+        prices = 100 * np.exp(np.cumsum(rng.normal(0.001, 0.02, 100)))
         
         for date, price in zip(dates, prices):
             data.append({
@@ -108,7 +108,7 @@ def test_portfolio_manager():
     print(f"\n✓ Correlation matrix computed")
     
     # Test top assets selection
-    last_date = ensemble.index.get_level_values('date').unique()[-1]
+    last_date = level_max(ensemble.index, 'date')
     top_assets = pm.get_top_assets(last_date)
     
     print(f"\n✓ Top assets selection working")
@@ -144,6 +144,11 @@ def test_backtest_logic():
     print(f"  Initial: ${backtest.initial_capital:,.2f}")
     print(f"  Final: ${equity_curve['portfolio_value'].iloc[-1]:,.2f}")
     
+    # Batch (parameter sweep) runs match single runs
+    batch = BacktestEngine(initial_capital=10000, commission=0.001).run_batch(data, [signals, signals])
+    assert len(batch) == 2, "Missing batch results"
+    pd.testing.assert_frame_equal(batch[1], equity_curve)
+    
     # Get metrics
     metrics = backtest.get_performance_metrics()
     print(f"\n✓ Performance metrics calculated:")
@@ -153,6 +158,83 @@ def test_backtest_logic():
     return True
 
 
+def test_numba_kernels():
+    """Test compiled rolling kernels against the pandas reference."""
+    print("\n" + "="*60)
+    print("TEST 4: Numba Kernels vs pandas")
+    print("="*60)
+    
+    from numba_kernels import NUMBA_AVAILABLE, rolling_mean, qpi_features, drawdown, equity_stats, rank_pct_rows
+    
+    close = generate_simple_test_data()['close'].xs('ASSET_01', level='ticker')
+    returns = close.pct_change()
+    
+    expected_ma = close.rolling(50, min_periods=1).mean()
+    expected_vol = returns.rolling(20, min_periods=1).std()
+    expected_hist = returns.rolling(60, min_periods=20).mean()
+    
+    ma, recent_vol, historical_vol = qpi_features(close.to_numpy(), 50, 20, 60)
+    
+    np.testing.assert_allclose(rolling_mean(close.to_numpy(), 50, 1), expected_ma, rtol=1e-10)
+    np.testing.assert_allclose(ma, expected_ma, rtol=1e-10)
+    np.testing.assert_allclose(recent_vol, expected_vol, rtol=1e-8)
+    np.testing.assert_allclose(historical_vol, expected_hist, rtol=1e-8, atol=1e-12)
+    
+    cumulative = (1 + returns).cumprod()
+    running_max = cumulative.expanding().max()
+    np.testing.assert_allclose(drawdown(close.to_numpy()), (cumulative - running_max) / running_max, rtol=1e-10)
+    
+    daily_vol, max_drawdown = equity_stats(close.to_numpy())
+    np.testing.assert_allclose(daily_vol, returns.std(), rtol=1e-10)
+    np.testing.assert_allclose(max_drawdown, ((cumulative - running_max) / running_max).min(), rtol=1e-10)
+    
+    wide = generate_simple_test_data()['close'].unstack('ticker').round(0)
+    np.testing.assert_allclose(rank_pct_rows(wide.to_numpy()), wide.rank(axis=1, pct=True), rtol=1e-12)
+    
+    print(f"✓ Kernels match pandas rolling (numba available: {NUMBA_AVAILABLE})")
+    
+    return True
+
+
+def test_gappy_signals():
+    """Test signals on tickers with missing dates against the pandas groupby reference."""
+    print("\n" + "="*60)
+    print("TEST 5: Signals with Missing Dates")
+    print("="*60)
+    
+    data = generate_simple_test_data()
+    
+    # Drop every 7th row from the middle of one ticker's history
+    asset_rows = np.flatnonzero(data.index.get_level_values('ticker') == 'ASSET_02')
+    data = data.drop(data.index[asset_rows[10:-10:7]])
+    
+    # Reference: rolling windows and returns over each ticker's own rows
+    by_ticker = data.groupby(level='ticker')['close']
+    returns = by_ticker.pct_change()
+    
+    sma = by_ticker.transform(lambda x: x.rolling(20, min_periods=1).mean())
+    expected_trend = np.tanh((data['close'] - sma) / sma * 5).fillna(0.0)
+    
+    ma = by_ticker.transform(lambda x: x.rolling(20, min_periods=1).mean())
+    recent_vol = returns.groupby(level='ticker').transform(lambda x: x.rolling(10, min_periods=1).std())
+    historical_vol = returns.groupby(level='ticker').transform(lambda x: x.rolling(40, min_periods=10).mean())
+    vol_ratio = recent_vol / (historical_vol + 1e-8)
+    qpi = data['close'] / ma * vol_ratio
+    expected_mr = (1.0 - 2.0 * qpi.groupby(level='date').rank(pct=True)).fillna(0.0)
+    
+    trend = SimpleTrend(name="GapTrend", sma_period=20).generate_signals(data)
+    mr = MeanReversionQP(name="GapMR", lookback_ma=20, lookback_vol=10,
+                         historical_vol_period=40).generate_signals(data)
+    
+    np.testing.assert_allclose(trend['signal'], expected_trend, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(mr['signal'], expected_mr, rtol=1e-9, atol=1e-12)
+    np.testing.assert_allclose(mr['confidence'], (1.0 / (1.0 + vol_ratio)).fillna(0.5), rtol=1e-9)
+    
+    print(f"✓ Signals match the per-ticker reference ({len(asset_rows[10:-10:7])} rows dropped)")
+    
+    return True
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*70)
@@ -166,6 +248,8 @@ def main():
         test_strategy_interface()
         test_portfolio_manager()
         test_backtest_logic()
+        test_numba_kernels()
+        test_gappy_signals()
         
         print("\n" + "="*70)
         print("✓ ALL TESTS PASSED - SYSTEM IS OPERATIONAL")
@@ -6,7 +6,8 @@ Classic momentum: "Buy the winners, sell the losers"
 
 import pandas as pd
 import numpy as np
-from strategy_base import Strategy
+from strategy_base import Strategy, close_matrix
+from numba_kernels import rolling_mean_2d
 
 
 class SimpleTrend(Strategy):
@@ -39,28 +40,32 @@ class SimpleTrend(Strategy):
         Returns:
             DataFrame with 'signal' column: +1.0 (strong uptrend) to -1.0 (strong downtrend)
         """
-        df = data.copy()
-        
-        # Calculate SMA
-        df['sma'] = df.groupby(level='ticker')['close'].transform(
-            lambda x: x.rolling(self.sma_period, min_periods=1).mean()
-        )
+        # Calculate SMA (compiled O(1) sliding-window mean per ticker column
+        # of the shared wide close matrix, over each ticker's own rows)
+        closes = close_matrix(data)
+        close = data['close'].to_numpy(dtype=np.float64)
+        sma = closes.to_long(rolling_mean_2d(closes.values, closes.present, self.sma_period, 1))
         
         # Price distance from SMA (percentage)
-        df['distance_pct'] = (df['close'] - df['sma']) / df['sma']
+        distance_pct = (close - sma) / sma
         
         # Generate signals: positive distance = bullish, negative = bearish
         # Clip to [-1, 1] range and apply tanh for smooth scaling
-        df['signal'] = np.tanh(df['distance_pct'] * 5)  # 5 is sensitivity factor
+        signal = np.tanh(distance_pct * 5)  # 5 is sensitivity factor
         
         # Handle NaN values
-        df['signal'] = df['signal'].fillna(0.0)
+        signal[np.isnan(signal)] = 0.0
         
         # Confidence: based on how far we are from SMA (larger distance = higher confidence)
-        df['confidence'] = np.abs(df['distance_pct']).clip(0, 0.2) / 0.2  # Normalize to [0, 1]
-        df['confidence'] = df['confidence'].fillna(0.5)
+        confidence = np.clip(np.abs(distance_pct), 0, 0.2) / 0.2  # Normalize to [0, 1]
+        confidence[np.isnan(confidence)] = 0.5
         
-        return df[['signal', 'confidence']]
+        # Build the output directly on data.index (no copy of the input frame)
+        return pd.DataFrame(
+            {'signal': signal, 'confidence': confidence},
+            index=data.index,
+            copy=False
+        )
     
     def __repr__(self) -> str:
         return f"SimpleTrend(name='{self.name}', SMA={self.sma_period})"